@@ -6,6 +6,7 @@ from collections.abc import Mapping
 from typing import Optional, Tuple, Union
 
 from .._version import __version__
+from ..auth import WaylayTokenAuth
 from ..config import WaylayConfig
 from .exceptions import SyncCtxMgtNotSupportedError
 from .http import AsyncClient, HttpClientOptions, Request, Response
@@ -116,8 +117,11 @@ class ApiClient(WithSerializationSupport):
     async def aclose(self):
         """Close the client."""
         if self._http_client and not self.is_closed:
+            auth = self._http_client.auth
             await self._http_client.aclose()
             self._http_client = None
+            if isinstance(auth, WaylayTokenAuth):
+                await auth.aclose()
 
     async def _request(self, *args, **kwargs) -> Response:
         """Invoke a http request."""
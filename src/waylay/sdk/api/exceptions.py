@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, List
 
 from ..exceptions import RequestError, RestResponseError, WaylayError
 from .http import Response
@@ -57,12 +57,11 @@ class ApiError(RestResponseError):
         """Create an instance from a REST exception response."""
         return cls(message, response=response, data=data)
 
-    def __str__(self):
-        """Get the string representation of the exception."""
-        error_message = super().__str__()
+    def _str_lines(self) -> List[str]:
+        lines = super()._str_lines()
         if self.data and self.data != self.response.content:
-            error_message += f"\nResponse data: {self.data}"
-        return error_message
+            lines.append(f"Response data: {self.data}")
+        return lines
 
 
 class SyncCtxMgtNotSupportedError(WaylayError, TypeError):
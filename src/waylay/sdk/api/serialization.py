@@ -15,6 +15,7 @@ from collections.abc import (
     Iterable,
     Mapping,
 )
+from functools import lru_cache
 from inspect import isclass
 from typing import (
     Any,
@@ -237,6 +238,15 @@ def _convert_content(content: Any):
     # do not handle cases httpx handles
     if isinstance(content, (bytes, str, AsyncIterable)):
         return content
+    # read file-like content in large chunks rather than iterating it per line.
+    if isinstance(content, Readable):
+
+        async def _read_reader_async():
+            while chunk := content.read(_CHUNK_SIZE):
+                yield chunk
+
+        return _read_reader_async()
+
     # non-dict Iterables fail when using async client, convert to async iterable.
     if isinstance(content, Iterable) and not isinstance(content, dict):
 
@@ -245,14 +255,6 @@ def _convert_content(content: Any):
                 yield chunk
 
         return _read_iterable_async()
-
-    if isinstance(content, Readable):
-
-        async def _read_reader_async():
-            while chunk := content.read(_CHUNK_SIZE):
-                yield chunk
-
-        return _read_reader_async()
     return content
 
 
@@ -279,12 +281,7 @@ def _deserialize(data: Any, klass: Any):
     """Deserializes response content into a `klass` instance."""
     if isinstance(klass, str) and klass in _CLASS_MAPPING:
         klass = _CLASS_MAPPING[klass]
-    config = (
-        ConfigDict(arbitrary_types_allowed=True)
-        if not isclass(klass) or not issubclass(klass, BaseModel)
-        else None
-    )
-    type_adapter = TypeAdapter(klass, config=config)
+    type_adapter = _type_adapter_for(klass)
     try:
         return type_adapter.validate_python(data)
     except (TypeError, ValidationError) as exc:
@@ -320,6 +317,31 @@ def _deserialize(data: Any, klass: Any):
                 return data
 
 
+def _type_adapter_for(klass: Any) -> TypeAdapter:
+    """Get a (cached) type adapter to deserialize into `klass`."""
+    try:
+        hash(klass)
+    except TypeError:
+        return _create_type_adapter(klass)
+    # typing considers `Union[int, float]` equal to `Union[float, int]`,
+    # but pydantic validates union members in order: include the repr in the key.
+    return _cached_type_adapter(klass, repr(klass))
+
+
+def _create_type_adapter(klass: Any) -> TypeAdapter:
+    config = (
+        ConfigDict(arbitrary_types_allowed=True)
+        if not isclass(klass) or not issubclass(klass, BaseModel)
+        else None
+    )
+    return TypeAdapter(klass, config=config)
+
+
+@lru_cache(maxsize=256)
+def _cached_type_adapter(klass: Any, _type_repr: str) -> TypeAdapter:
+    return _create_type_adapter(klass)
+
+
 def _response_type_for_status_code(
     status_code,
     response_type: TypeMapping,
@@ -337,16 +359,21 @@ def _response_type_for_status_code(
     return _DEFAULT_RESPONSE_TYPE
 
 
+_MULTI_SELECT_RE = re.compile(r"\[(\*|.*:.*|.*,.*)\]")
+
+
+@lru_cache(maxsize=256)
+def _compile_select_path(select_path: str) -> tuple[Any, bool]:
+    """Parse a json path, and tell whether it selects multiple values."""
+    return jsonpath_parse(select_path), bool(_MULTI_SELECT_RE.search(select_path))
+
+
 def _extract_selected(data, select_path: str):
     if not select_path:
         return data
-    jsonpath_expr = jsonpath_parse(select_path)
+    jsonpath_expr, multiple = _compile_select_path(select_path)
     match_values = [match.value for match in jsonpath_expr.find(data)]
-    data = (
-        match_values[0]
-        if not re.search(r"\[(\*|.*:.*|.*,.*)\]", select_path)
-        else match_values
-    )
+    data = match_values if multiple else match_values[0]
     return data
 
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import re
 import urllib.parse
+from functools import lru_cache
 from getpass import getpass
 
 import httpx
@@ -155,6 +156,7 @@ def _gateway_url_for(url_input: str):
     return _root_url_for(url_input)
 
 
+@lru_cache(maxsize=64)
 def _root_url_for(host_or_url: str) -> str:
     scheme, loc, path, query, fragment = urllib.parse.urlsplit(host_or_url)
 
@@ -6,7 +6,9 @@ import abc
 import base64
 import binascii
 import json
-from dataclasses import dataclass
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, ClassVar, Dict, List
@@ -37,10 +39,17 @@ class CredentialsType(str, Enum):
 
 TokenString = str
 
+# slotted dataclasses are only supported from python 3.10
+_DATACLASS_SLOTS: Dict[str, Any] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
 
 class WaylayCredentials(abc.ABC):
     """Base class for the representation of credentials to the waylay platform."""
 
+    __slots__ = ()
+
     gateway_url: str | None = None
     credentials_type: ClassVar[CredentialsType] = CredentialsType.CALLBACK
 
@@ -75,15 +84,27 @@ class WaylayCredentials(abc.ABC):
         """
 
 
-@dataclass(repr=False)
+@dataclass(repr=False, **_DATACLASS_SLOTS)
 class CredentialsBase(WaylayCredentials):
     """Dataclass mixin for the 'gateway_url' (legacy 'accounts_url') property."""
 
     gateway_url: str | None = None
     accounts_url: str | None = None
+    _str_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any):
+        """Set an attribute, invalidating the cached string representation."""
+        object.__setattr__(self, "_str_cache", None)
+        object.__setattr__(self, name, value)
 
+    def __str__(self):
+        """Show the credential attributes, with secrets obfuscated."""
+        if self._str_cache is None:
+            object.__setattr__(self, "_str_cache", WaylayCredentials.__str__(self))
+        return self._str_cache
 
-@dataclass(repr=False, init=False)
+
+@dataclass(repr=False, init=False, **_DATACLASS_SLOTS)
 class KeySecretCredentials(CredentialsBase):
     """Dataclass mixin for the 'api_key' and 'api_secret'."""
 
@@ -99,7 +120,9 @@ class KeySecretCredentials(CredentialsBase):
         accounts_url: str | None = None,
     ):
         """Initialise with the api_key and api_secret."""
-        super().__init__(gateway_url=gateway_url, accounts_url=accounts_url)
+        CredentialsBase.__init__(
+            self, gateway_url=gateway_url, accounts_url=accounts_url
+        )
         self.api_key = api_key
         self.api_secret = api_secret
 
@@ -108,6 +131,12 @@ class KeySecretCredentials(CredentialsBase):
         """Get the main identifier for this credential."""
         return self.api_key
 
+    @property
+    def token_url(self) -> str:
+        """Get the url of the endpoint that exchanges these credentials for a token."""
+        token_url_prefix = self.accounts_url or f"{self.gateway_url}/accounts/v1"
+        return f"{token_url_prefix}/tokens"
+
     @classmethod
     def create(
         cls,
@@ -159,7 +188,7 @@ class KeySecretCredentials(CredentialsBase):
         return True
 
 
-@dataclass(repr=False, init=False)
+@dataclass(repr=False, init=False, **_DATACLASS_SLOTS)
 class NoCredentials(CredentialsBase):
     """Credentials that be resolved via (interactive) callback when required."""
 
@@ -183,14 +212,14 @@ class NoCredentials(CredentialsBase):
         return None
 
 
-@dataclass(repr=False, init=False)
+@dataclass(repr=False, init=False, **_DATACLASS_SLOTS)
 class ClientCredentials(KeySecretCredentials):
     """Waylay Credentials: api key and secret of type 'client_credentials'."""
 
     credentials_type: ClassVar[CredentialsType] = CredentialsType.CLIENT
 
 
-@dataclass(repr=False, init=False)
+@dataclass(repr=False, init=False, **_DATACLASS_SLOTS)
 class ApplicationCredentials(KeySecretCredentials):
     """Waylay Credentials: api key and secret of type 'application_credentials'."""
 
@@ -207,19 +236,23 @@ class ApplicationCredentials(KeySecretCredentials):
         accounts_url: str | None = None,
     ):
         """Initialise with the api_key and api_secret."""
-        super().__init__(
-            api_key, api_secret, gateway_url=gateway_url, accounts_url=accounts_url
+        KeySecretCredentials.__init__(
+            self,
+            api_key,
+            api_secret,
+            gateway_url=gateway_url,
+            accounts_url=accounts_url,
         )
         self.tenant_id = tenant_id
 
     def to_dict(self, obfuscate=True):
         """Get the dict representation."""
-        _dict = super().to_dict(obfuscate)
+        _dict = KeySecretCredentials.to_dict(self, obfuscate)
         _dict["tenant_id"] = self.tenant_id
         return _dict
 
 
-@dataclass(repr=False, init=False)
+@dataclass(repr=False, init=False, **_DATACLASS_SLOTS)
 class TokenCredentials(CredentialsBase):
     """Waylay JWT Token credentials."""
 
@@ -234,7 +267,9 @@ class TokenCredentials(CredentialsBase):
         accounts_url: str | None = None,
     ):
         """Create a TokenCredentials from a token string."""
-        super().__init__(gateway_url=gateway_url, accounts_url=accounts_url)
+        CredentialsBase.__init__(
+            self, gateway_url=gateway_url, accounts_url=accounts_url
+        )
         self.token = token
 
     @property
@@ -267,10 +302,16 @@ class TokenCredentials(CredentialsBase):
 class WaylayToken:
     """Holds a Waylay JWT token."""
 
+    __slots__ = ("token_string", "token_data")
+
     def __init__(self, token_string: str, token_data: Dict | None = None):
         """Create a Waylay Token holder object from given token string or data."""
         self.token_string = token_string
         if token_data is None:
+            if isinstance(token_string, str) and token_string.count(".") != 2:
+                # cheap structural check: a jwt has three dot-separated segments
+                exc = JWTError("Not enough segments")
+                raise TokenParseError(exc) from exc
             try:
                 token_data = jwt.decode(
                     token_string, "", options=dict(verify_signature=False)
@@ -346,13 +387,13 @@ class WaylayToken:
     def expires_seconds(self) -> int:
         """Get seconds until expiry."""
         exp = self.token_data.get("exp", None)
-        return 0 if exp is None else exp - datetime.now().timestamp()
+        return 0 if exp is None else exp - time.time()
 
     @property
     def age(self) -> int:
         """Get seconds sinds issuance."""
         iat = self.token_data.get("iat", 0)
-        return int(datetime.now().timestamp() - iat)
+        return int(time.time() - iat)
 
     @property
     def is_expired(self) -> bool:
@@ -363,8 +404,8 @@ class WaylayToken:
         """
         if not isinstance(self.token_data, dict):
             return True
-        exp = self.expires_at
-        return exp is None or exp < datetime.now()
+        exp = self.token_data.get("exp", None)
+        return exp is None or exp < time.time()
 
     @property
     def is_valid(self) -> bool:
@@ -373,11 +414,14 @@ class WaylayToken:
         True if essential token data is present and is not expired.
 
         """
+        # expiry is checked first: it is the most likely reason to fail
+        if self.is_expired:
+            return False
+        token_data = self.token_data
         return (
-            self.tenant is not None
-            and self.subject is not None
-            and self.domain is not None
-            and not self.is_expired
+            token_data.get("tenant") is not None
+            and token_data.get("sub") is not None
+            and token_data.get("domain") is not None
         )
 
     def to_dict(self):
@@ -1,6 +1,8 @@
 """Parse credentials."""
 
-from typing import Any, Dict
+from __future__ import annotations
+
+from typing import Any, Dict, List, Type
 
 from .model import (
     ApplicationCredentials,
@@ -10,20 +12,32 @@ from .model import (
     WaylayCredentials,
 )
 
+_CREDENTIALS_CLASSES: List[Type[WaylayCredentials]] = [
+    NoCredentials,
+    ClientCredentials,
+    ApplicationCredentials,
+    TokenCredentials,
+]
+_CREDENTIALS_CLASS_FOR_TYPE: Dict[str, Type[WaylayCredentials]] = {
+    clz.credentials_type.value: clz for clz in _CREDENTIALS_CLASSES
+}
 
-def parse_credentials(json_obj: Dict[str, Any]) -> WaylayCredentials:
-    """Convert a parsed json representation to a WaylayCredentials object."""
+
+def parse_credentials(
+    json_obj: Dict[str, Any] | WaylayCredentials,
+) -> WaylayCredentials:
+    """Convert a parsed json representation to a WaylayCredentials object.
+
+    A WaylayCredentials object is returned as-is.
+    """
+    if isinstance(json_obj, WaylayCredentials):
+        return json_obj
     cred_type = json_obj.get("type")
     if cred_type is None:
         raise ValueError("invalid json for credentials: missing type")
-
-    for clz in [
-        NoCredentials,
-        ClientCredentials,
-        ApplicationCredentials,
-        TokenCredentials,
-    ]:
-        if clz.credentials_type == cred_type:  # type: ignore
-            return clz(**{k: v for k, v in json_obj.items() if k != "type"})
-
-    raise ValueError(f"cannot parse json for credential type {cred_type}")
+    clz = _CREDENTIALS_CLASS_FOR_TYPE.get(cred_type)
+    if clz is None:
+        raise ValueError(f"cannot parse json for credential type {cred_type}")
+    cred_args = dict(json_obj)
+    del cred_args["type"]
+    return clz(**cred_args)
@@ -2,8 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 from collections.abc import AsyncGenerator
-from typing import Callable, Generator, Optional
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import httpx
 
@@ -21,6 +35,88 @@ from .model import (
 
 CredentialsCallback = Callable[[Optional[str]], WaylayCredentials]
 
+_CLIENT_CREDENTIALS_GRANT_PARAMS = {"grant_type": "client_credentials"}
+
+_TokenSource = Literal["callback", "request", "token"]
+
+# how a token is obtained, by credentials class (subclasses are resolved on use)
+_TOKEN_SOURCE_FOR_CLASS: Dict[Type[WaylayCredentials], _TokenSource | None] = {
+    NoCredentials: "callback",
+    ClientCredentials: "request",
+    ApplicationCredentials: "request",
+    KeySecretCredentials: "request",
+    TokenCredentials: "token",
+}
+
+
+def _token_source_for(credentials: WaylayCredentials) -> _TokenSource | None:
+    """Get the token source for the credentials class, or None if unsupported."""
+    clz = type(credentials)
+    source = _TOKEN_SOURCE_FOR_CLASS.get(clz)
+    if source is not None:
+        return source
+    return _token_source_for_subclass(clz)
+
+
+@lru_cache(maxsize=64)
+def _token_source_for_subclass(
+    clz: Type[WaylayCredentials],
+) -> _TokenSource | None:
+    return next(
+        (
+            source
+            for base_class, source in _TOKEN_SOURCE_FOR_CLASS.items()
+            if issubclass(clz, base_class)
+        ),
+        None,
+    )
+
+
+# token requests are infrequent: keep few connections open for a refresh cycle
+_TOKEN_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=4, keepalive_expiry=300)
+_shared_http_client_sync: httpx.Client | None = None
+# async http clients can only be shared within the event loop that uses them
+_shared_http_clients_async: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def _shared_token_http_client_sync() -> httpx.Client:
+    """Get the http client shared by all token providers for sync requests."""
+    global _shared_http_client_sync
+    if _shared_http_client_sync is None or _shared_http_client_sync.is_closed:
+        _shared_http_client_sync = httpx.Client(limits=_TOKEN_HTTP_LIMITS)
+    return _shared_http_client_sync
+
+
+@atexit.register
+def _close_shared_token_http_client_sync():
+    """Close the shared sync http client and its pooled connections."""
+    if _shared_http_client_sync is not None:
+        _shared_http_client_sync.close()
+
+
+def _shared_token_http_client_async(
+    loop: asyncio.AbstractEventLoop,
+) -> httpx.AsyncClient:
+    """Get the http client shared by all token providers within an event loop."""
+    http_client = _shared_http_clients_async.get(loop)
+    if http_client is None or http_client.is_closed:
+        # forget the clients of event loops that were closed without closing them
+        for closed_loop in [
+            other for other in _shared_http_clients_async if other.is_closed()
+        ]:
+            del _shared_http_clients_async[closed_loop]
+        http_client = httpx.AsyncClient(limits=_TOKEN_HTTP_LIMITS)
+        _shared_http_clients_async[loop] = http_client
+    return http_client
+
+
+async def _close_shared_token_http_client_async():
+    """Close the http client shared by token providers within the running loop."""
+    loop = asyncio.get_running_loop()
+    http_client = _shared_http_clients_async.pop(loop, None)
+    if http_client is not None:
+        await http_client.aclose()
+
 
 class WaylayTokenAuth(httpx.Auth):
     """Authentication flow with a waylay token.
@@ -31,8 +127,9 @@ class WaylayTokenAuth(httpx.Auth):
     AUTH_EXCEPTION = AuthError
     current_token: WaylayToken | None
     credentials: WaylayCredentials
-    http_client_sync: httpx.Client
-    http_client_async: httpx.AsyncClient
+    _http_client_sync: httpx.Client | None
+    _http_client_async: httpx.AsyncClient | None
+    _token_request_args: Tuple[Tuple[Any, ...], Dict[str, Any]] | None = None
 
     def __init__(
         self,
@@ -43,16 +140,46 @@ class WaylayTokenAuth(httpx.Auth):
         """Create a Waylay Token authentication provider."""
         self.credentials = credentials
         self.current_token = None
-        self.http_client_sync = (
-            http_client if isinstance(http_client, httpx.Client) else httpx.Client()
+        self._http_client_sync = (
+            http_client if isinstance(http_client, httpx.Client) else None
         )
-        self.http_client_async = (
-            http_client
-            if isinstance(http_client, httpx.AsyncClient)
-            else httpx.AsyncClient()
+        self._http_client_async = (
+            http_client if isinstance(http_client, httpx.AsyncClient) else None
         )
         self.credentials_callback = credentials_callback
 
+    @property
+    def http_client_sync(self) -> httpx.Client:
+        """Get the http client used for synchronous token requests.
+
+        Unless provided at construction, this is a client shared by all
+        token providers.
+        """
+        if self._http_client_sync is not None:
+            return self._http_client_sync
+        return _shared_token_http_client_sync()
+
+    @property
+    def http_client_async(self) -> httpx.AsyncClient:
+        """Get the http client used for asynchronous token requests.
+
+        Unless provided at construction, this is a client shared by all
+        token providers within the running event loop, and can only be
+        retrieved from within that loop.
+        """
+        if self._http_client_async is not None:
+            return self._http_client_async
+        return _shared_token_http_client_async(asyncio.get_running_loop())
+
+    async def aclose(self):
+        """Close the shared http client used for asynchronous token requests.
+
+        The client shared within the running event loop is replaced when
+        used again. A http client provided at construction is left open.
+        """
+        if self._http_client_async is None:
+            await _close_shared_token_http_client_async()
+
     async def async_auth_flow(
         self, request: httpx.Request
     ) -> AsyncGenerator[httpx.Request, httpx.Response]:
@@ -74,10 +201,12 @@ class WaylayTokenAuth(httpx.Auth):
         if self.current_token and self.current_token.is_valid:
             return self.current_token
         credentials = self._validate_credentials()
-        if isinstance(credentials, TokenCredentials):
-            token_str = credentials.token
+        if _token_source_for(credentials) == "token":
+            token_str = cast(TokenCredentials, credentials).token
         else:
-            token_str = self._request_token_sync(credentials)
+            token_str = self._request_token_sync(
+                cast(KeySecretCredentials, credentials)
+            )
         self.current_token = self._create_and_validate_token_sync(token_str)
         return self.current_token
 
@@ -86,59 +215,81 @@ class WaylayTokenAuth(httpx.Auth):
         if self.current_token and self.current_token.is_valid:
             return self.current_token
         credentials = self._validate_credentials()
-        if isinstance(credentials, TokenCredentials):
-            token_str = credentials.token
+        if _token_source_for(credentials) == "token":
+            token_str = cast(TokenCredentials, credentials).token
         else:
-            token_str = await self._request_token_async(credentials)
-        self.current_token = await self._create_and_validate_token_async(token_str)
+            token_str = await self._request_token_async(
+                cast(KeySecretCredentials, credentials)
+            )
+        self.current_token = self._create_and_validate_token_sync(token_str)
         return self.current_token
 
     def _create_and_validate_token_sync(self, token: TokenString) -> WaylayToken:
         return WaylayToken(token).validate()
 
-    async def _create_and_validate_token_async(self, token: TokenString) -> WaylayToken:
-        return self._create_and_validate_token_sync(token)
-
     def _validate_credentials(self) -> KeySecretCredentials | TokenCredentials:
-        if isinstance(self.credentials, NoCredentials):
+        token_source = _token_source_for(self.credentials)
+        if token_source == "callback":
             if self.credentials_callback is not None:
                 self.credentials = self.credentials_callback(
                     self.credentials.accounts_url or self.credentials.gateway_url
                 )
+                token_source = _token_source_for(self.credentials)
             else:
                 raise self.AUTH_EXCEPTION(
                     "No credentials or credentials_callback provided."
                 )
-        if isinstance(self.credentials, (KeySecretCredentials, TokenCredentials)):
-            return self.credentials
+        if token_source in ("request", "token"):
+            return cast(Union[KeySecretCredentials, TokenCredentials], self.credentials)
         raise self.AUTH_EXCEPTION(
             f"credentials of type {self.credentials.credentials_type} are not supported"
         )
 
-    def _token_request(self, credentials: KeySecretCredentials) -> httpx.Request:
-        http_client = self.http_client_async or self.http_client_sync
-        token_url_prefix = (
-            credentials.accounts_url or f"{credentials.gateway_url}/accounts/v1"
+    def _token_request(
+        self,
+        credentials: KeySecretCredentials,
+        http_client: httpx.Client | httpx.AsyncClient,
+    ) -> httpx.Request:
+        # credentials are mutable: key the cached arguments on the values used
+        cache_key = (
+            type(credentials),
+            credentials.token_url,
+            credentials.api_key,
+            credentials.api_secret,
+            getattr(credentials, "tenant_id", None),
         )
+        cached = self._token_request_args
+        if cached is None or cached[0] != cache_key:
+            cached = self._token_request_args = (
+                cache_key,
+                self._token_request_args_for(credentials),
+            )
+        return http_client.build_request("POST", **cached[1])
+
+    def _token_request_args_for(
+        self, credentials: KeySecretCredentials
+    ) -> Dict[str, Any]:
         if isinstance(credentials, ClientCredentials):
-            url = f"{token_url_prefix}/tokens"
-            params = {"grant_type": "client_credentials"}
-            json = {
-                "clientId": credentials.api_key,
-                "clientSecret": credentials.api_secret,
+            return {
+                "url": credentials.token_url,
+                "params": _CLIENT_CREDENTIALS_GRANT_PARAMS,
+                "json": {
+                    "clientId": credentials.api_key,
+                    "clientSecret": credentials.api_secret,
+                },
             }
-            return http_client.build_request("POST", url, params=params, json=json)
         if isinstance(credentials, ApplicationCredentials):
-            url = f"{token_url_prefix}/tokens"
-            params = {
-                "grant_type": "application_credentials",
-                "tenant": credentials.tenant_id,
-            }
-            json = {
-                "applicationId": credentials.api_key,
-                "applicationSecret": credentials.api_secret,
+            return {
+                "url": credentials.token_url,
+                "params": {
+                    "grant_type": "application_credentials",
+                    "tenant": credentials.tenant_id,
+                },
+                "json": {
+                    "applicationId": credentials.api_key,
+                    "applicationSecret": credentials.api_secret,
+                },
             }
-            return http_client.build_request("POST", url, params=params, json=json)
         raise self.AUTH_EXCEPTION(
             f"credentials of type {self.credentials.credentials_type} "
             "are not supported."
@@ -154,10 +305,14 @@ class WaylayTokenAuth(httpx.Auth):
 
     def _request_token_sync(self, credentials: KeySecretCredentials) -> str:
         return self._parse_token_response(
-            self.http_client_sync.send(self._token_request(credentials))
+            self.http_client_sync.send(
+                self._token_request(credentials, self.http_client_sync)
+            )
         )
 
     async def _request_token_async(self, credentials: KeySecretCredentials) -> str:
         return self._parse_token_response(
-            await self.http_client_async.send(self._token_request(credentials))
+            await self.http_client_async.send(
+                self._token_request(credentials, self.http_client_async)
+            )
         )
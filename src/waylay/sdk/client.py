@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from waylay.sdk.services.gateway import GatewayService
+from typing import TYPE_CHECKING, Tuple, Type
+from weakref import WeakValueDictionary
 
 from .api import ApiClient
 from .api.http import AsyncClient
@@ -20,6 +19,7 @@ if TYPE_CHECKING:
         RulesService,
         StorageService,
     )
+    from .services.gateway import GatewayService
 
 
 class WaylayClient(WithConfig, WithServicesAndTools):
@@ -53,12 +53,38 @@ class WaylayClient(WithConfig, WithServicesAndTools):
         WithConfig.__init__(self, client_config)
         WithServicesAndTools.__init__(self, api_client)
 
+    @classmethod
+    def get(
+        cls,
+        config: WaylayConfig,
+        /,
+        options: HttpClientOptions | AsyncClient | None = None,
+    ) -> WaylayClient:
+        """Get a client for the given configuration, reusing a live instance.
+
+        Without `options`, a client previously created with `get` for the same
+        configuration object is returned as long as it is referenced elsewhere,
+        preserving its http connection pool and services.
+        Clients with explicit `options` are never cached.
+        """
+        if options is not None:
+            return cls(config, options)
+        key = (cls, id(config))
+        client = _CLIENT_CACHE.get(key)
+        if client is None or client.config is not config:
+            client = _CLIENT_CACHE[key] = cls(config)
+        return client
+
     def __repr__(self):
         """Get a technical string representation of this instance."""
         return (
             f"<{self.__class__.__name__}("
-            f"services=[{','.join(self._services.keys())}],"
-            f"tools=[{','.join(self._tools.keys())}],"
+            f"{self._repr_plugin_names()},"
             f"config={self.config}"
             ")>"
         )
+
+
+_CLIENT_CACHE: WeakValueDictionary[Tuple[Type[WaylayClient], int], WaylayClient] = (
+    WeakValueDictionary()
+)
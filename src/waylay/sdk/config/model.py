@@ -6,16 +6,21 @@ import json
 import logging
 import os
 import re
+import time
 from collections.abc import Mapping, MutableMapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Type
+from typing import Any, ClassVar, Type
 
 import httpx
 from appdirs import user_config_dir
 
 from ..auth import (
+    ApplicationCredentials,
     AuthError,
+    ClientCredentials,
     NoCredentials,
+    TokenCredentials,
     WaylayCredentials,
     WaylayToken,
     parse_credentials,
@@ -56,15 +61,33 @@ DEFAULT_APIDOC_URL: str = "https://docs.waylay.io/openapi/public/redocly"
 DOC_URL_KEY: str = "doc_url"
 APIDOC_URL_KEY: str = "apidoc_url"
 
+_SETTINGS_KEY_PREFIX = "waylay_"
+_PROFILE_FILE_NAME_RE = re.compile(r"\.profile\.(.+)\.json")
+
 
 class WaylayConfig:
     """Manages the authentication and endpoint configuration for the Waylay Platform."""
 
+    __slots__ = (
+        "profile",
+        "_auth",
+        "_local_settings",
+        "_tenant_settings",
+        "settings_cache_ttl",
+    )
+
     profile: str
     _auth: WaylayTokenAuth
     _local_settings: Settings
-    _tenant_settings: TenantSettings | None = None
+    _tenant_settings: TenantSettings | None
     _token_auth_provider: Type[WaylayTokenAuth] = WaylayTokenAuth
+    settings_cache_ttl: float | None
+    """Seconds to keep fetched tenant settings in a local file cache.
+
+    The cache is shared between processes. Disabled when `None`.
+    """
+    default_settings_cache_ttl: ClassVar[float | None] = None
+    """The `settings_cache_ttl` of configurations that do not specify one."""
 
     def __init__(
         self,
@@ -73,9 +96,16 @@ class WaylayConfig:
         settings: TenantSettings | None = None,
         fetch_tenant_settings=True,
         credentials_callback: CredentialsCallback | None = None,
+        settings_cache_ttl: float | None = None,
     ):
         """Create a WaylayConfig."""
         self.profile = profile
+        self.settings_cache_ttl = (
+            self.default_settings_cache_ttl
+            if settings_cache_ttl is None
+            else settings_cache_ttl
+        )
+        self._tenant_settings = None
         if credentials is None:
             credentials = NoCredentials()
         self._local_settings = {}
@@ -114,15 +144,15 @@ class WaylayConfig:
             if use_gateway
             else default_root_url
         )
-        settings = self.local_settings
-        if not use_gateway:
+        if use_gateway:
+            url_override = self.local_settings.get(config_key)
+        else:
             resolve_settings = (
                 resolve_settings
                 # do not lookup settings for the bootstrap services
                 and config_key not in (SERVICE_KEY_ACCOUNTS)
             )
-            settings = self.get_settings(resolve=resolve_settings)
-        url_override = settings.get(config_key)
+            url_override = self._get_setting(config_key, resolve=resolve_settings)
         if url_override is not None:
             url_override = _root_url_for(url_override)
             if url_override.endswith(default_root_path):
@@ -158,12 +188,14 @@ class WaylayConfig:
     @property
     def doc_url(self) -> str:
         """Get the root url of the documentation site."""
-        return self.settings.get(DOC_URL_KEY, DEFAULT_DOC_URL)
+        doc_url = self._get_setting(DOC_URL_KEY)
+        return DEFAULT_DOC_URL if doc_url is None else doc_url
 
     @property
     def apidoc_url(self) -> str:
         """Get the root url of the api documentation site."""
-        return self.settings.get(APIDOC_URL_KEY, DEFAULT_APIDOC_URL)
+        apidoc_url = self._get_setting(APIDOC_URL_KEY)
+        return DEFAULT_APIDOC_URL if apidoc_url is None else apidoc_url
 
     @property
     def tenant_settings(self) -> TenantSettings:
@@ -215,6 +247,13 @@ class WaylayConfig:
             **self.local_settings,
         }
 
+    def _get_setting(self, config_key: str, resolve=True) -> str | None:
+        """Look up a single setting, without merging all settings."""
+        if config_key in self._local_settings:
+            return self._local_settings[config_key]
+        tenant_settings = self.tenant_settings if resolve else self._tenant_settings
+        return tenant_settings.get(config_key) if tenant_settings else None
+
     async def get_valid_token(self) -> WaylayToken:
         """Get the current valid authentication token or fail."""
         if isinstance(self.auth, WaylayTokenAuth):
@@ -241,6 +280,47 @@ class WaylayConfig:
         return f"{root_url}/settings"
 
     def _request_settings(self) -> TenantSettings:
+        if not self.settings_cache_ttl:
+            return self._fetch_settings()
+        cache_key = self._settings_cache_key()
+        if cache_key is None:
+            return self._fetch_settings()
+        cache_path = self.settings_cache_path()
+        cached: Any = _load_settings_cache(cache_path).get(cache_key)
+        if _is_settings_cache_entry(cached) and cached["expires"] > time.time():
+            return cached["settings"]
+        settings = self._fetch_settings()
+        if settings:
+            _store_settings_cache(
+                cache_path, cache_key, settings, time.time() + self.settings_cache_ttl
+            )
+        return settings
+
+    def _settings_cache_key(self) -> str | None:
+        tenant_key = _tenant_key_for(self.credentials)
+        if tenant_key is None:
+            # settings are tenant specific: do not cache for an unknown tenant.
+            return None
+        return f"{self.global_settings_url}#{tenant_key}"
+
+    def invalidate_settings_cache(self):
+        """Remove the cached tenant settings for this configuration.
+
+        Settings are fetched again on next usage.
+
+        """
+        self._tenant_settings = None
+        cache_key = self._settings_cache_key()
+        cache_path = self.settings_cache_path()
+        if cache_key is not None and os.path.exists(cache_path):
+            _store_settings_cache(cache_path, cache_key, None)
+
+    @classmethod
+    def settings_cache_path(cls) -> str:
+        """Compute the default OS path of the tenant settings cache."""
+        return os.path.join(_sdk_config_dir(), ".settings_cache.json")
+
+    def _fetch_settings(self) -> TenantSettings:
         try:
             settings_resp = _http_get_global_settings(
                 self.global_settings_url, auth=self.auth
@@ -249,7 +329,7 @@ class WaylayConfig:
             return {
                 key: value
                 for key, value in settings_resp.json().items()
-                if key.startswith("waylay_")
+                if key.startswith(_SETTINGS_KEY_PREFIX)
             }
         except _http.HTTPStatusError as exc:
             if exc.response.status_code == 403:
@@ -271,9 +351,7 @@ class WaylayConfig:
     @classmethod
     def config_file_path(cls, profile: str = DEFAULT_PROFILE) -> str:
         """Compute the default OS path used to store this configuration."""
-        return os.path.join(
-            user_config_dir("Waylay"), "python_sdk", f".profile.{profile}.json"
-        )
+        return os.path.join(_sdk_config_dir(), f".profile.{profile}.json")
 
     @classmethod
     def load(
@@ -372,7 +450,8 @@ class WaylayConfig:
         return {
             profile_match[1]: str(config_file)
             for config_file in config_dir.iterdir()
-            for profile_match in [re.match(r"\.profile\.(.*)\.json", config_file.name)]
+            if config_file.name.startswith(".profile.")
+            for profile_match in [_PROFILE_FILE_NAME_RE.fullmatch(config_file.name)]
             if profile_match
         }
 
@@ -385,7 +464,77 @@ class WaylayConfig:
         return json.dumps(self.to_dict(obfuscate=True))
 
 
+@lru_cache(maxsize=None)
+def _sdk_config_dir() -> str:
+    return os.path.join(user_config_dir("Waylay"), "python_sdk")
+
+
+def _tenant_key_for(credentials: WaylayCredentials) -> str | None:
+    """Get a key that identifies the tenant of the credentials, if known."""
+    if isinstance(credentials, ApplicationCredentials):
+        return f"tenant:{credentials.tenant_id}" if credentials.tenant_id else None
+    if isinstance(credentials, ClientCredentials):
+        # api keys belong to a single tenant
+        return f"api_key:{credentials.api_key}" if credentials.api_key else None
+    if isinstance(credentials, TokenCredentials):
+        try:
+            tenant = WaylayToken(credentials.token).tenant
+        except AuthError:
+            return None
+        return f"tenant:{tenant}" if tenant else None
+    return None
+
+
+def _load_settings_cache(cache_path: str) -> dict[str, Any]:
+    try:
+        with open(cache_path, encoding="utf-8") as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    # the cache is best-effort: an unexpected file content is a cache miss
+    return cache if isinstance(cache, dict) else {}
+
+
+def _is_settings_cache_entry(entry: Any) -> bool:
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("expires"), (int, float))
+        and isinstance(entry.get("settings"), dict)
+    )
+
+
+def _store_settings_cache(
+    cache_path: str,
+    cache_key: str,
+    settings: TenantSettings | None,
+    expires: float = 0,
+):
+    now = time.time()
+    cache = {
+        key: entry
+        for key, entry in _load_settings_cache(cache_path).items()
+        if key != cache_key
+        and _is_settings_cache_entry(entry)
+        and entry["expires"] > now
+    }
+    if settings is not None:
+        cache[cache_key] = {"expires": expires, "settings": settings}
+    try:
+        Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, mode="w", encoding="utf-8") as cache_file:
+            json.dump(cache, cache_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        log.warning("Cannot write tenant settings cache %s: %s", cache_path, exc)
+
+
 def _root_url_key_for(config_key: str):
-    if config_key.startswith("waylay_"):
+    if config_key.startswith(_SETTINGS_KEY_PREFIX):
         return config_key
-    return f"waylay_{config_key}"
+    return _prefixed_root_url_key_for(config_key)
+
+
+@lru_cache(maxsize=64)
+def _prefixed_root_url_key_for(config_key: str):
+    return f"{_SETTINGS_KEY_PREFIX}{config_key}"
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import List
+
 from .api.http import Request, Response
 
 
@@ -33,6 +35,7 @@ class RestRequestError(RestError):
     """Exception class for failures to prepare a REST call."""
 
     request: Request | None
+    _str_cache: str | None = None
 
     def __init__(
         self,
@@ -44,19 +47,37 @@ class RestRequestError(RestError):
         self.request = request
 
     def __str__(self):
-        """Get the string representation of the exception."""
-        error_message = super().__str__()
-        if self.request is None:
-            return error_message
+        """Get the string representation of the exception.
+
+        Rendered once, when the rendered state can no longer change.
+        """
+        if self._str_cache is not None:
+            return self._str_cache
+        rendered = "\n".join(self._str_lines())
+        if self._str_final():
+            self._str_cache = rendered
+        return rendered
+
+    def _str_final(self) -> bool:
+        # an unread request stream renders differently once its content is read
+        return (
+            self.request is None or getattr(self.request, "_content", None) is not None
+        )
+
+    def _str_lines(self) -> List[str]:
+        lines = [super().__str__()]
         req = self.request
-        error_message += f"\nRequest: {req.method} {req.url}"
+        if req is None:
+            return lines
+        lines.append(f"Request: {req.method} {req.url}")
         if req.headers:
-            error_message += f"\nRequest headers: {req.headers}"
-        if hasattr(req, "_content"):
-            error_message += f"\nRequest content: <bytes: len={len(req._content)}>"
+            lines.append(f"Request headers: {req.headers}")
+        content = getattr(req, "_content", None)
+        if content is not None:
+            lines.append(f"Request content: <bytes: len={len(content)}>")
         else:
-            error_message += f"\nRequest content: <streaming: {req.stream}>"
-        return error_message
+            lines.append(f"Request content: <streaming: {req.stream}>")
+        return lines
 
 
 class RestResponseError(RestRequestError):
@@ -73,21 +94,30 @@ class RestResponseError(RestRequestError):
         super().__init__(*args, request=response._request)
         self.response = response
 
-    def __str__(self):
-        """Get the string representation of the exception."""
-        error_message = super().__repr__()
+    def _str_lines(self) -> List[str]:
         resp = self.response
-        error_message += f"\nStatus: {resp.status_code}"
-        error_message += f"\nReason: {resp.reason_phrase}"
+        lines = [
+            super().__repr__(),
+            f"Status: {resp.status_code}",
+            f"Reason: {resp.reason_phrase}",
+        ]
         if resp.headers:
-            error_message += f"\nResponse headers: {resp.headers}"
-        if hasattr(self.response, "_content"):
-            error_message += f"\nResponse content: <bytes: len={len(resp._content)}>"
+            lines.append(f"Response headers: {resp.headers}")
+        content = getattr(resp, "_content", None)
+        if content is not None:
+            lines.append(f"Response content: <bytes: len={len(content)}>")
         else:
-            error_message += (
-                f"\nResponse content: <streaming: len={resp.num_bytes_downloaded}>"
+            lines.append(
+                f"Response content: <streaming: len={resp.num_bytes_downloaded}>"
             )
-        return error_message
+        return lines
+
+    def _str_final(self) -> bool:
+        # an unread response renders differently once its content is read
+        return (
+            super()._str_final()
+            and getattr(self.response, "_content", None) is not None
+        )
 
 
 class RestResponseParseError(RestResponseError):
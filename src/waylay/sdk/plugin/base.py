@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterator, Mapping
-from typing import Generic, Type, TypeVar
+from typing import Callable, Generic, Optional, Type, TypeVar
 
 from ..api import ApiClient, HttpClientOptions
 from ..api.exceptions import SyncCtxMgtNotSupportedError
@@ -15,6 +15,8 @@ PI = TypeVar("PI", bound="WaylayPlugin")
 class WithApiClient:
     """Base Waylay plugin class."""
 
+    __slots__ = ("api_client",)
+
     api_client: ApiClient
 
     def __init__(self, api_client: ApiClient):
@@ -23,7 +25,9 @@ class WithApiClient:
 
     async def __aenter__(self):
         """Initialize the api client."""
-        self(None)
+        if not self.api_client.is_closed:
+            # the context needs an http client of its own.
+            self.api_client = self.api_client.clone()
         self.api_client = await self.api_client.__aenter__()
         return self
 
@@ -31,6 +35,9 @@ class WithApiClient:
         """Initialize the http client."""
         if self.api_client.is_closed:
             self.api_client.set_options(http_options)
+        elif http_options is None:
+            # keep the open client and its connection pool.
+            return self
         else:
             # create a new api client.
             # leave the previous client for other services.
@@ -53,6 +60,8 @@ class WithApiClient:
 class WaylayPlugin(WithApiClient):
     """Plugin for the Waylay SDK client."""
 
+    __slots__ = ()
+
     name: str = "__NO_NAME__"
     title: str = "__NO_TITLE__"
     description: str | None = None
@@ -69,34 +78,72 @@ class WaylayPlugin(WithApiClient):
 class WaylayService(WaylayPlugin):
     """Base Waylay service class."""
 
+    __slots__ = ()
+
+
+PluginResolver = Callable[[Optional[str]], None]
+
 
 class PluginAccess(Mapping[str, P], Generic[P]):
     """A lookup API for tools or services."""
 
+    __slots__ = ("_items", "base_class", "_resolve")
+
     base_class: Type[P]
 
-    def __init__(self, items: Mapping[str, P], base_class: Type[P]):
-        """Create accessor for SDK plugins."""
+    def __init__(
+        self,
+        items: Mapping[str, P],
+        base_class: Type[P],
+        resolve: PluginResolver | None = None,
+    ):
+        """Create accessor for SDK plugins.
+
+        The optional `resolve` callback loads lazily registered plugins
+        before a lookup: it receives the plugin name, or `None` when all
+        plugins are needed.
+        """
         self._items = items
         self.base_class = base_class
+        self._resolve = resolve
 
     def __getitem__(self, __key: str) -> P:
         """Get an SDK plugin by key."""
+        if self._resolve is not None:
+            self._resolve(__key)
         return self._items.__getitem__(__key)
 
+    def __contains__(self, __key: object) -> bool:
+        """Check whether an SDK plugin is registered by key."""
+        if self._resolve is not None and isinstance(__key, str):
+            self._resolve(__key)
+        return __key in self._items
+
+    def get(self, __key: str, default=None):
+        """Get an SDK plugin by key, or the default."""
+        if self._resolve is not None:
+            self._resolve(__key)
+        return self._items.get(__key, default)
+
     def __iter__(self) -> Iterator[str]:
         """Iterate SDK plugin keys."""
+        if self._resolve is not None:
+            self._resolve(None)
         return self._items.__iter__()
 
     def __len__(self) -> int:
         """Count registred SDK plugin."""
+        if self._resolve is not None:
+            self._resolve(None)
         return self._items.__len__()
 
     def iter(self, item_class: Type[PI], name: str | None = None) -> Iterator[PI]:
         """Iterate over the plugins that satisfy the requirements."""
+        if self._resolve is not None:
+            self._resolve(name or None)
         if name:
-            plug = self._items.get(name, None)
-            if isinstance(plug, item_class):
+            plug = self._items.get(name)
+            if plug is not None and isinstance(plug, item_class):
                 yield plug
             return
         for plug in self._items.values():
@@ -105,7 +152,15 @@ class PluginAccess(Mapping[str, P], Generic[P]):
 
     def select(self, item_class: Type[PI], name: str | None = None) -> PI | None:
         """Select the first SDK plugin that satifies the class and name requirements."""
-        return next(self.iter(item_class, name), None)
+        if self._resolve is not None:
+            self._resolve(name or None)
+        if name:
+            plug = self._items.get(name)
+            return plug if isinstance(plug, item_class) else None
+        for plug in self._items.values():
+            if isinstance(plug, item_class):
+                return plug
+        return None
 
     def require(self, item_class: Type[PI], name: str | None = None) -> PI:
         """Get the SDK plugin for the given class or raise a ConfigError."""
@@ -117,7 +172,19 @@ class PluginAccess(Mapping[str, P], Generic[P]):
 
     def __getattr__(self, name: str) -> P:
         """Get a plugin by name."""
-        return self.require(self.base_class, name)
+        # only reached for unset slots on a partially constructed instance
+        if name in PluginAccess.__slots__:
+            raise AttributeError(name)
+        if name[:1] != "_":
+            try:
+                return self[name]
+            except KeyError:
+                pass
+        raise AttributeError(f"{self.base_class.__name__} '{name}' is not available.")
+
+    def __reduce__(self):
+        """Support copy and pickle by reconstructing from the constructor args."""
+        return (self.__class__, (self._items, self.base_class, self._resolve))
 
     def __repr__(self):
         """Get string representation."""
@@ -127,6 +194,8 @@ class PluginAccess(Mapping[str, P], Generic[P]):
 class WaylayTool(WaylayPlugin):
     """A tool extension for the waylay sdk."""
 
+    __slots__ = ("_services", "_tools")
+
     _services: PluginAccess[WaylayService]
     _tools: "PluginAccess[WaylayTool]"
 
@@ -2,14 +2,116 @@
 
 from __future__ import annotations
 
+import importlib
 import sys
+import threading
 import warnings
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
 from importlib.metadata import entry_points
-from typing import Dict, Type
+from typing import Dict, List, Literal, Type, Union, cast
+from weakref import WeakKeyDictionary
 
 from ..api import ApiClient
 from .base import PluginAccess, WaylayPlugin, WaylayService, WaylayTool, WithApiClient
 
+PluginReference = str
+"""Lazy reference to a plugin class, as `'<module>:<ClassName>'`."""
+
+PluginSpecs = Union[
+    Iterable[Type[WaylayPlugin]],
+    Mapping[str, Union[Type[WaylayPlugin], PluginReference]],
+]
+"""Plugins exposed by a loader.
+
+Either a sequence of plugin classes, or a mapping of plugin names to a plugin
+class or a lazy plugin reference. A referenced plugin is only imported when
+it is first accessed.
+"""
+
+_PLUGIN_LOCK = threading.RLock()
+
+_PluginKind = Literal["service", "tool"]
+# weakly keyed: plugin classes that are no longer used can be released
+_PLUGIN_KIND_FOR_CLASS: WeakKeyDictionary[type, _PluginKind | None] = (
+    WeakKeyDictionary()
+)
+
+
+def _plugin_kind_for(plugin_class: type) -> _PluginKind | None:
+    try:
+        return _PLUGIN_KIND_FOR_CLASS[plugin_class]
+    except KeyError:
+        pass
+    kind: _PluginKind | None = None
+    if issubclass(plugin_class, WaylayService):
+        kind = "service"
+    elif issubclass(plugin_class, WaylayTool):
+        kind = "tool"
+    _PLUGIN_KIND_FOR_CLASS[plugin_class] = kind
+    return kind
+
+
+_PLUGIN_EP_GROUP = "dynamic"
+_PLUGIN_EP_NAME = "waylay_sdk_plugins"
+
+if sys.version_info >= (3, 10):
+
+    def _plugin_entry_points():
+        return entry_points(group=_PLUGIN_EP_GROUP, name=_PLUGIN_EP_NAME)
+
+else:
+
+    def _plugin_entry_points():
+        return [
+            ep
+            for ep in entry_points().get(_PLUGIN_EP_GROUP, [])
+            if ep.name == _PLUGIN_EP_NAME
+        ]
+
+
+_PLUGIN_SPECS_CACHE: List[PluginSpecs] | None = None
+
+
+def _discover_plugin_specs() -> List[PluginSpecs]:
+    """Load the plugin specs of all installed loaders (once per process)."""
+    global _PLUGIN_SPECS_CACHE
+    if _PLUGIN_SPECS_CACHE is not None:
+        return _PLUGIN_SPECS_CACHE
+    with _PLUGIN_LOCK:
+        if _PLUGIN_SPECS_CACHE is None:
+            _PLUGIN_SPECS_CACHE = [
+                _valid_plugin_specs(ep.load()) for ep in _plugin_entry_points()
+            ]
+        return _PLUGIN_SPECS_CACHE
+
+
+def _valid_plugin_specs(plugins: PluginSpecs) -> PluginSpecs:
+    """Drop invalid plugin classes from loaded specs, warning once for each."""
+
+    def _is_valid(plugin) -> bool:
+        if isinstance(plugin, str) or _plugin_kind_for(plugin) is not None:
+            return True
+        warnings.warn(message=f"Invalid plug class: {plugin}", stacklevel=1)
+        return False
+
+    if isinstance(plugins, Mapping):
+        return {name: plugin for name, plugin in plugins.items() if _is_valid(plugin)}
+    return [plugin for plugin in plugins if _is_valid(plugin)]
+
+
+def _reset_plugin_cache():
+    """Forget discovered plugin loaders, so they are loaded again."""
+    global _PLUGIN_SPECS_CACHE
+    _PLUGIN_SPECS_CACHE = None
+    _import_plugin_class.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _import_plugin_class(reference: PluginReference) -> Type[WaylayPlugin]:
+    module_name, _, class_name = reference.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
 
 class WithServicesAndTools(WithApiClient):
     """Client as loader of service and tool plugins."""
@@ -18,48 +120,85 @@ class WithServicesAndTools(WithApiClient):
     tools: PluginAccess[WaylayTool]
     _services: Dict[str, WaylayService]
     _tools: Dict[str, WaylayTool]
+    _plugin_refs: Dict[str, PluginReference]
+    _plugin_names_repr: str | None = None
 
     def __init__(self, api_client: ApiClient):
         """Create a WaylayConfig instance."""
         super().__init__(api_client)
+        self._plugin_refs = {}
         self._services = {}
-        self.services = PluginAccess[WaylayService](self._services, WaylayService)
+        self.services = PluginAccess[WaylayService](
+            self._services, WaylayService, self._resolve_plugins
+        )
         self._tools = {}
-        self.tools = PluginAccess[WaylayTool](self._tools, WaylayTool)
+        self.tools = PluginAccess[WaylayTool](
+            self._tools, WaylayTool, self._resolve_plugins
+        )
         self._load_plugins()
 
     def _load_plugins(self):
-        ep_group = "dynamic"
-        ep_name = "waylay_sdk_plugins"
-        if sys.version_info >= (3, 10):
-            waylay_entry_points = entry_points(group=ep_group, name=ep_name)
-        else:
-            waylay_entry_points = [
-                ep for ep in entry_points().get(ep_group, []) if ep.name == ep_name
-            ]
-        for ep in waylay_entry_points:
-            for plugin_class in ep.load():
+        for plugins in _discover_plugin_specs():
+            self._load_plugin_specs(plugins)
+
+    def _load_plugin_specs(self, plugins: PluginSpecs):
+        if not isinstance(plugins, Mapping):
+            for plugin_class in plugins:
                 self.register(plugin_class)
+            return
+        for name, plugin in plugins.items():
+            if isinstance(plugin, str):
+                self._plugin_refs[name] = plugin
+            else:
+                self.register(plugin)
+
+    def _resolve_plugins(self, name: str | None = None):
+        """Import and register lazily referenced plugins (all if `name` is None)."""
+        if not self._plugin_refs:
+            return
+        with _PLUGIN_LOCK:
+            names = list(self._plugin_refs) if name is None else [name]
+            for ref_name in names:
+                reference = self._plugin_refs.get(ref_name)
+                if reference is not None:
+                    # keep the reference until the plugin is registered
+                    self.register(_import_plugin_class(reference))
+                    self._plugin_refs.pop(ref_name, None)
 
     def register(self, plugin_class: Type[WaylayPlugin]) -> WaylayPlugin | None:
         """Register and instantiate plugin class."""
-        if issubclass(plugin_class, WaylayService):
-            service = plugin_class(self.api_client)
-            self._services[service.name] = service
+        self._plugin_refs.pop(plugin_class.name, None)
+        kind = _plugin_kind_for(plugin_class)
+        if kind == "service":
+            service = cast(Type[WaylayService], plugin_class)(self.api_client)
+            self._services[sys.intern(service.name)] = service
+            self._plugin_names_repr = None
             return service
-        if issubclass(plugin_class, WaylayTool):
-            tool = plugin_class(
+        if kind == "tool":
+            tool = cast(Type[WaylayTool], plugin_class)(
                 self.api_client,
                 services=self.services,
                 tools=self.tools,
             )
-            self._tools[tool.name] = tool
+            self._tools[sys.intern(tool.name)] = tool
+            self._plugin_names_repr = None
             return tool
         warnings.warn(message=f"Invalid plug class: {plugin_class}", stacklevel=1)
         return None
 
+    def _repr_plugin_names(self) -> str:
+        """Get the registered service and tool names, as shown in `repr`."""
+        if self._plugin_names_repr is None:
+            self._plugin_names_repr = (
+                f"services=[{','.join(self._services)}],"
+                f"tools=[{','.join(self._tools)}]"
+            )
+        return self._plugin_names_repr
+
     def __getattr__(self, name: str):
         """Get plugin by name."""
+        if name in self._plugin_refs:
+            self._resolve_plugins(name)
         if name in self._services:
             return self._services[name]
         if name in self._tools:
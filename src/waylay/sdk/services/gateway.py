@@ -134,9 +134,9 @@ class AboutApi(WithApiClient):
         response_type_map: Dict[str, Any] = (
             {"2XX": response_type}
             if response_type is not None
-            else {
-                "200": GatewayResponse if not select_path else Model,
-            }
+            else _SELECT_RESPONSE_TYPE_MAP
+            if select_path
+            else _DEFAULT_RESPONSE_TYPE_MAP
         )
         return await self.api_client.request(
             method="GET",
@@ -163,3 +163,7 @@ class GatewayResponse(WaylayBaseModel):
         protected_namespaces=(),
         extra="allow",
     )
+
+
+_DEFAULT_RESPONSE_TYPE_MAP: Dict[str, Any] = {"200": GatewayResponse}
+_SELECT_RESPONSE_TYPE_MAP: Dict[str, Any] = {"200": Model}
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
+from functools import lru_cache
 
 import pytest
 
-from waylay.sdk import ClientCredentials, WaylayClient, WaylayCredentials
+from waylay.sdk import ClientCredentials, WaylayClient, WaylayConfig, WaylayCredentials
 from waylay.sdk.auth.provider import WaylayTokenAuth
 
 
@@ -77,11 +79,19 @@ def _create_client_from_profile_or_creds(
 ) -> WaylayClient:
     profile = os.getenv("WAYLAY_TEST_PROFILE")
     if profile:
-        return WaylayClient.from_profile(profile)
+        return WaylayClient(
+            WaylayConfig.from_dict(json.loads(_load_test_profile_json(profile)))
+        )
     else:
         return WaylayClient.from_credentials(credentials)
 
 
+@lru_cache(maxsize=None)
+def _load_test_profile_json(profile: str) -> str:
+    # read the profile once per test run, but give each client its own config.
+    return json.dumps(WaylayConfig.load(profile).to_dict(obfuscate=False))
+
+
 @pytest.fixture(scope="session", name="waylay_session_test_client")
 def fixture_waylay_session_test_client(
     waylay_test_client_credentials: WaylayCredentials,
@@ -39,9 +39,8 @@ async def test_create_client_from_profile(
     waylay_test_user_id, waylay_test_user_secret, waylay_test_gateway_url, monkeypatch
 ):
     """Test profile creation dialog."""
-    user_dialog = (
-        response
-        for response in [
+    user_dialog = iter(
+        [
             "alternate gateway",
             waylay_test_gateway_url,
             "apiKey",
@@ -54,13 +53,14 @@ async def test_create_client_from_profile(
     )
 
     def mock_ask(prompt: str) -> str:
-        assert next(user_dialog) in prompt
+        expected = next(user_dialog, None)
+        assert expected is not None, f"unexpected prompt: {prompt}"
+        assert expected in prompt, f"expected '{expected}' in prompt: {prompt}"
         return next(user_dialog)
 
     def mock_ask_secret(prompt: str) -> str:
         assert "Secret" in prompt
-        assert next(user_dialog) in prompt
-        return next(user_dialog)
+        return mock_ask(prompt)
 
     monkeypatch.setattr(waylay.sdk.auth.interactive, "ask", mock_ask)
     monkeypatch.setattr(waylay.sdk.auth.interactive, "ask_secret", mock_ask_secret)
@@ -68,6 +68,7 @@ async def test_create_client_from_profile(
     waylay_client = WaylayClient.from_profile(
         "example", gateway_url=waylay_test_gateway_url
     )
+    assert next(user_dialog, None) is None, "dialog not completed"
     assert waylay_test_gateway_url == waylay_client.config.gateway_url
     gateway_version = await waylay_client.gateway.about.get()
     assert gateway_version is not None
@@ -1,9 +1,11 @@
 """Test tools and services."""
 
-from typing import List, Type
+from typing import Tuple, Type
 
 from waylay.sdk import WaylayPlugin
 
 from .plugins import ExampleService, ExampleTool
 
-PLUGINS: List[Type[WaylayPlugin]] = [ExampleService, ExampleTool]
+__all__ = ["PLUGINS"]
+
+PLUGINS: Tuple[Type[WaylayPlugin], ...] = (ExampleService, ExampleTool)
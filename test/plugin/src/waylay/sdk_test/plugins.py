@@ -6,6 +6,8 @@ from waylay.sdk import WaylayService, WaylayTool
 class ExampleService(WaylayService):
     """Example service."""
 
+    __slots__ = ()
+
     name = "exampleService"
     title = "Example Service"
 
@@ -13,5 +15,7 @@ class ExampleService(WaylayService):
 class ExampleTool(WaylayTool):
     """Example tool."""
 
+    __slots__ = ()
+
     name = "exampleTool"
     title = "Example Tool"
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import io
 from collections.abc import AsyncIterator
 from datetime import date, datetime
 from pathlib import Path
@@ -10,6 +11,7 @@ from typing import Any, Dict, List, Union
 
 import httpx
 import pytest
+import pytest_asyncio
 from pytest_httpx import HTTPXMock
 from syrupy.filters import paths
 
@@ -19,6 +21,7 @@ from waylay.sdk.api.exceptions import ApiError, ApiValueError, RestResponseError
 from waylay.sdk.api.http import Request, Response
 from waylay.sdk.auth import TokenCredentials
 from waylay.sdk.config import WaylayConfig
+from waylay.sdk.exceptions import RestRequestError
 
 from .example.pet_fixtures import (
     pet_instance,
@@ -31,19 +34,33 @@ from .example.pet_fixtures import (
 from .example.pet_model import Pet, PetList, PetType, PetUnion, PetWithAlias
 
 
-@pytest.fixture(name="waylay_credentials")
+@pytest.fixture(name="waylay_credentials", scope="session")
 def _fixture_waylay_token_credentials() -> TokenCredentials:
     return TokenCredentials(token="dummy_token", gateway_url="https://api-example.io")
 
 
-@pytest.fixture(name="waylay_config")
+@pytest.fixture(name="waylay_config", scope="session")
 def _fixture_waylay_config(waylay_credentials) -> WaylayConfig:
     return WaylayConfig(waylay_credentials)
 
 
-@pytest.fixture(name="waylay_api_client")
-def _fixture_waylay_api_client(waylay_config: WaylayConfig) -> ApiClient:
-    return ApiClient(waylay_config, {"auth": None})
+@pytest_asyncio.fixture(name="waylay_api_client", scope="module")
+async def _fixture_waylay_api_client(
+    waylay_config: WaylayConfig,
+) -> AsyncIterator[ApiClient]:
+    # shared by the tests of this module: async tests that use it
+    # must run on the module event loop.
+    api_client = ApiClient(waylay_config, {"auth": None})
+    yield api_client
+    await api_client.aclose()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fixture_fixed_multipart_boundary(module_mocker):
+    module_mocker.patch(
+        "httpx._models.get_multipart_boundary_from_content_type",
+        lambda content_type: b"---boundary---",
+    )
 
 
 async def _iter_some_binary_content():
@@ -53,20 +70,20 @@ async def _iter_some_binary_content():
     yield b"content"
 
 
-class BinaryReader:
-    """Custom binary reader."""
+@pytest.fixture
+def binary_async_iterable_content():
+    return _iter_some_binary_content()
 
-    pos = 0
-    data = b"some binary content"
 
-    def read(self, b_len=2):
-        """Read binary data."""
-        pos = self.pos
-        size = min(len(self.data) - pos, b_len)
-        if size <= 0:
-            return b""
-        self.pos = pos + size
-        return self.data[pos : pos + size]
+@pytest.fixture
+def binary_io_buffer_content():
+    with (Path(__file__).parent / "__init__.py").open(mode="rb") as buffer:
+        yield buffer
+
+
+@pytest.fixture
+def binary_io_content():
+    return io.BytesIO(b"some binary content")
 
 
 SERIALIZE_CASES = {
@@ -134,17 +151,17 @@ SERIALIZE_CASES = {
     "binary_async_iterable": {
         "method": "POST",
         "resource_path": "/service/v1/bar/foo",
-        "content": _iter_some_binary_content(),
+        "content": binary_async_iterable_content,
     },
     "binary_io_buffer": {
         "method": "POST",
         "resource_path": "/service/v1/bar/foo",
-        "content": (Path(__file__).parent / "__init__.py").open(mode="rb"),
+        "content": binary_io_buffer_content,
     },
     "binary_io": {
         "method": "POST",
         "resource_path": "/service/v1/bar/foo",
-        "content": BinaryReader(),
+        "content": binary_io_content,
     },
     "form": {
         "method": "POST",
@@ -160,29 +177,19 @@ SERIALIZE_CASES = {
 }
 
 
+@pytest.mark.asyncio(scope="module")
 @pytest.mark.parametrize(
     "test_input", SERIALIZE_CASES.values(), ids=SERIALIZE_CASES.keys()
 )
-async def test_serialize_and_call(
+async def test_serialize(
     snapshot,
-    httpx_mock: HTTPXMock,
     waylay_api_client: ApiClient,
     test_input: dict[str, Any],
     request,
-    mocker,
 ):
     """Test REST param serializer."""
     test_input = _retrieve_fixture_values(request, test_input)
-    mocker.patch(
-        "httpx._models.get_multipart_boundary_from_content_type",
-        lambda content_type: b"---boundary---",
-    )
     request = waylay_api_client.build_request(**test_input)
-    httpx_mock.add_response()
-    await waylay_api_client.send(request)
-    requests = httpx_mock.get_requests()
-    assert len(requests) == 1
-    request = requests[0]
     request_data = await request.aread()
     assert (
         request.__dict__,
@@ -191,21 +198,67 @@ async def test_serialize_and_call(
     ) == snapshot(exclude=paths("0._content", "0.headers", "0.stream", "1.user-agent"))
 
 
-async def test_call_invalid_method(waylay_api_client: ApiClient):
+@pytest.mark.asyncio(scope="module")
+async def test_serialize_and_call(
+    httpx_mock: HTTPXMock,
+    waylay_api_client: ApiClient,
+):
+    """A serialized request is sent as built."""
+    request = waylay_api_client.build_request(**SERIALIZE_CASES["form"])
+    httpx_mock.add_response()
+    await waylay_api_client.send(request)
+    requests = httpx_mock.get_requests()
+    assert len(requests) == 1
+    assert requests[0].method == request.method
+    assert requests[0].url == request.url
+    assert requests[0].headers == request.headers
+    assert requests[0].content == request.content == b"key=value"
+
+
+class BinaryReader:
+    """Custom binary reader."""
+
+    pos = 0
+    data = b"some binary content"
+
+    def read(self, b_len=2):
+        """Read binary data."""
+        pos = self.pos
+        size = min(len(self.data) - pos, b_len)
+        if size <= 0:
+            return b""
+        self.pos = pos + size
+        return self.data[pos : pos + size]
+
+
+@pytest.mark.asyncio(scope="module")
+async def test_serialize_custom_reader(
+    httpx_mock: HTTPXMock, waylay_api_client: ApiClient
+):
+    """Content with only a binary read method is streamed."""
+    request = waylay_api_client.build_request(
+        "POST", "/service/v1/bar/foo", content=BinaryReader()
+    )
+    httpx_mock.add_response()
+    await waylay_api_client.send(request)
+    sent_data = await httpx_mock.get_requests()[0].aread()
+    assert sent_data == b"some binary content"
+
+
+def test_call_invalid_method(waylay_api_client: ApiClient):
     """REST client should throw on invalid http method."""
     with pytest.raises(ApiValueError):
         waylay_api_client.build_request(method="invalid", resource_path="/")
 
 
-async def test_call_invalid_content(waylay_api_client: ApiClient):
+def test_call_invalid_content(waylay_api_client: ApiClient):
     """Cannot use a dict as `content` argument."""
     with pytest.raises(TypeError, match="Unexpected type"):
         waylay_api_client.build_request("POST", "", content={"should": "not work"})
 
 
 DESERIALIZE_CASES = [
-    (
-        "text_str_str",
+    pytest.param(
         {
             "status_code": 200,
             "text": "some_text_resopnse",
@@ -213,81 +266,84 @@ DESERIALIZE_CASES = [
         },
         {"200": str},
         None,
+        id="text_str_str",
     ),
-    (
-        "text_str_str_str",
-        {"status_code": 200, "text": "some_text_resopnse"},
-        {"200": "str"},
-        None,
-    ),
-    (
-        "text_str",
+    pytest.param(
         {"status_code": 200, "text": "some_text_resopnse"},
         {},  # no response mapping
         None,
+        id="text_str",
     ),
-    ("primitive_text_int", {"status_code": 200, "text": "123"}, {"200": int}, None),
-    (
-        "primitive_text_float",
+    pytest.param(
+        {"status_code": 200, "text": "123"}, {"200": int}, None, id="primitive_text_int"
+    ),
+    pytest.param(
         {"status_code": 200, "text": "123.456"},
         {"200": float},
         None,
+        id="primitive_text_float",
     ),
-    (
-        "primitive_json_float",
+    pytest.param(
         {"status_code": 200, "json": 123.456},
         {"200": "float"},
         None,
+        id="primitive_json_float",
     ),
-    (
-        "json_str",
+    pytest.param(
         {"status_code": 200, "json": "123"},
         {},  # no response mapping
         None,
+        id="json_str",
     ),
-    (
-        "json_number",
+    pytest.param(
         {"status_code": 200, "json": 123},
         {},  # no response mapping
         None,
+        id="json_number",
     ),
-    ("json_str_bool", {"status_code": 200, "text": "true"}, {"200": bool}, None),
-    (
-        "json_bool_bool",
+    pytest.param(
+        {"status_code": 200, "text": "true"}, {"200": bool}, None, id="json_str_bool"
+    ),
+    pytest.param(
         {"status_code": 200, "json": False},
         {
             "200": "bool"
         },  # TODO fix parsing of falsy boolean values (currently returns 'bytes')
         None,
+        id="json_bool_bool",
     ),
-    (
-        "json_bool",
+    pytest.param(
         {"status_code": 200, "json": True},
         {},  # no response mapping
         None,
+        id="json_bool",
     ),
-    (
-        "json_dict_object",
+    pytest.param(
         {"status_code": 200, "json": {"hello": "world", "key": [1, 2, 3]}},
         {"200": object},
         None,
+        id="json_dict_object",
     ),
-    (
-        "json_dict",
+    pytest.param(
         {"status_code": 200, "json": {"hello": "world", "key": [1, 2, 3]}},
         {},  # no response mapping
         None,
+        id="json_dict",
     ),
-    (
-        "content_none",
+    pytest.param(
         {"status_code": 200, "content": None},
         {},  # no response mapping
         None,
+        id="content_none",
+    ),
+    pytest.param(
+        {"status_code": 200, "content": None},
+        {"200": None},
+        None,
+        id="content_none_none",
     ),
-    ("content_none_none", {"status_code": 200, "content": None}, {"200": None}, None),
     # dict response type
-    (
-        "json_dict_dict",
+    pytest.param(
         {
             "status_code": 201,
             "json": {
@@ -297,9 +353,9 @@ DESERIALIZE_CASES = [
         },
         {"201": Dict[str, str]},
         None,
+        id="json_dict_dict",
     ),
-    (
-        "json_dict_2XX_dict",
+    pytest.param(
         {
             "status_code": 201,
             "json": {
@@ -309,9 +365,9 @@ DESERIALIZE_CASES = [
         },
         {"2XX": Dict[str, str]},
         None,
+        id="json_dict_2XX_dict",
     ),
-    (
-        "json_dict_default_dict",
+    pytest.param(
         {
             "status_code": 201,
             "json": {
@@ -321,9 +377,9 @@ DESERIALIZE_CASES = [
         },
         {"default": dict},
         None,
+        id="json_dict_default_dict",
     ),
-    (
-        "json_dict_no_mapping",
+    pytest.param(
         {
             "status_code": 201,
             "json": {
@@ -333,10 +389,10 @@ DESERIALIZE_CASES = [
         },
         {"4XX": Dict[str, str]},  # no response mapping
         None,
+        id="json_dict_no_mapping",
     ),
     # binary response types
-    (
-        "content_bin_bytearray",
+    pytest.param(
         {
             "status_code": 202,
             "content": b"some binary file content,",
@@ -344,19 +400,9 @@ DESERIALIZE_CASES = [
         },
         {"202": bytearray},
         None,
+        id="content_bin_bytearray",
     ),
-    (
-        "content_bin_XX_bytearay",
-        {
-            "status_code": 202,
-            "content": b"some binary file content,",
-            "headers": {"content-type": "application/octet-stream"},
-        },
-        {"2XX": "bytearray"},
-        None,
-    ),
-    (
-        "content_bin_*_bytearray",
+    pytest.param(
         {
             "status_code": 202,
             "content": b"some binary file content,",
@@ -364,177 +410,181 @@ DESERIALIZE_CASES = [
         },
         {"*": bytes},
         None,
+        id="content_bin_*_bytearray",
     ),
     # list response types
-    (
-        "json_list_XX_list_int",
+    pytest.param(
         {"status_code": 200, "json": ["11", "22", 33]},
         {"2XX": List[int]},
         None,
+        id="json_list_XX_list_int",
     ),
-    (
-        "json_list_X_union",
+    pytest.param(
         {"status_code": 200, "json": ["hello", "world", 123, {"key": "value"}]},
         {"2XX": List[Union[str, int, Dict[str, Any]]]},
         None,
+        id="json_list_X_union",
     ),
-    (
-        "json_list_x_list",
+    pytest.param(
         {"status_code": 200, "json": ["hello", "world", 123, {"key": "value"}]},
         {"2XX": list},
         None,
+        id="json_list_x_list",
     ),
-    (
-        "json_list",
+    pytest.param(
         {"status_code": 200, "json": ["hello", "world", 123, {"key": "value"}]},
         {},  # no response type
         None,
+        id="json_list",
     ),
     # datetime response types
-    (
-        "text_str_datetime",
+    pytest.param(
         {
             "status_code": 200,
             "text": datetime(2023, 12, 25, minute=1).isoformat(),
         },
         {"200": datetime},
         None,
+        id="text_str_datetime",
     ),
-    (
-        "text_str_date",
+    pytest.param(
         {
             "status_code": 200,
             "text": date(2023, 12, 25).isoformat(),
         },
         {"2XX": date},
         None,
+        id="text_str_date",
     ),
-    (
-        "text_str_invalid_date",
+    pytest.param(
         {
             "status_code": 200,
             "text": "2023/12/25:12.02.20",
         },  # invalid date should result in str
         {"2XX": date},
         None,
+        id="text_str_invalid_date",
     ),
-    (
-        "text_datestr_str",
+    pytest.param(
         {
             "status_code": 200,
             "text": datetime(2023, 12, 25, minute=1).isoformat(),
         },
         {"2XX": str},
         None,
+        id="text_datestr_str",
     ),
-    (
-        "text_str",
+    pytest.param(
         {
             "status_code": 200,
             "text": datetime(2023, 12, 25, minute=1).isoformat(),
         },
         {},  # no response type
         None,
+        id="text_str",
     ),
     # enum response types
-    ("text_str_Enum", {"status_code": 200, "text": "dog"}, {"*": PetType}, None),
+    pytest.param(
+        {"status_code": 200, "text": "dog"}, {"*": PetType}, None, id="text_str_Enum"
+    ),
     # fallback model responses
-    (
-        "json_dict_any_model",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": Model},
         None,
+        id="json_dict_any_model",
     ),
-    (
-        "json_list_any_model",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"*": Model},
         None,
+        id="json_list_any_model",
     ),
-    (
-        "dict_with_self_model",
+    pytest.param(
         {"status_code": 200, "json": {"self": "me"}},
         {"*": Model},
         None,
+        id="dict_with_self_model",
     ),
     # custom model response types
-    (
-        "json_dict_model",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": Pet},
         None,
+        id="json_dict_model",
     ),
-    (
-        "text_str_model",
+    pytest.param(
         {"status_code": 200, "text": pet_instance_json},
         {"2XX": Pet},
         None,
+        id="text_str_model",
     ),
-    (
-        "content_str_model",
+    pytest.param(
         {"status_code": 200, "content": pet_instance_json},
         {"*": Pet},
         None,
+        id="content_str_model",
     ),
-    (
-        "json_dict_any",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": Any},
         None,
+        id="json_dict_any",
     ),
-    (
-        "json_dict_none",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": None},
         None,
+        id="json_dict_none",
     ),
-    ("json_dict", {"status_code": 200, "json": pet_instance_dict}, {}, None),
-    (
-        "json_list_model",
+    pytest.param(
+        {"status_code": 200, "json": pet_instance_dict}, {}, None, id="json_dict"
+    ),
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"200": PetList},
         None,
+        id="json_list_model",
     ),
-    (
-        "json_dict_union",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": Union[str, list[Pet], Pet]},
         None,
+        id="json_dict_union",
     ),
-    (
-        "json_dict_*_dummy_union",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"*": Union[Pet]},
         None,
+        id="json_dict_*_dummy_union",
     ),
-    (
-        "json_dict_*_union",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"*": PetUnion},
         None,
+        id="json_dict_*_union",
     ),
-    (
-        "json_list_*_union",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"*": PetUnion},
         None,
+        id="json_list_*_union",
     ),
-    (
-        "json_dict_model_with_alias_prop",
+    pytest.param(
         {"status_code": 200, "json": pet_with_alias_instance_dict},
         {"*": PetWithAlias},
         None,
+        id="json_dict_model_with_alias_prop",
     ),
     # Any response type (i.e. surpress deserialization)
-    (
-        "json_dict_model_any",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": Any},
         None,
+        id="json_dict_model_any",
     ),
     # type constructors that are not recognized by pydantic
-    (
-        "json_dict_namespace",
+    pytest.param(
         {
             "status_code": 201,
             "json": {
@@ -544,86 +594,86 @@ DESERIALIZE_CASES = [
         },
         {"2XX": SimpleNamespace},  # TODO fix: should return SimpleNamespace
         None,
+        id="json_dict_namespace",
     ),
     # select path argument
-    (
-        "json_dict_str_path_name",
+    pytest.param(
         {"status_code": 200, "json": pet_instance_dict},
         {"200": str},
         "name",
+        id="json_dict_str_path_name",
     ),
-    (
-        "json_list_model_path_pets",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"200": List[Pet]},
         "pets",
+        id="json_list_model_path_pets",
     ),
-    (
-        "json_list_any_model_path_pets",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"200": List[Model]},
         "pets",
+        id="json_list_any_model_path_pets",
     ),
-    (
-        "json_list_list_path_[*].name",
+    pytest.param(
         {"status_code": 200, "json": [pet_instance_dict]},
         {"200": List["str"]},
         "[*].name",
+        id="json_list_list_path_[*].name",
     ),
-    (
-        "json_list_list_path_pets[*].name",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"200": List[str]},
         "pets[*].name",
+        id="json_list_list_path_pets[*].name",
     ),
-    (
-        "json_list_list_path_pets[0].name",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"200": str},
         "pets[0].name",
+        id="json_list_list_path_pets[0].name",
     ),
-    (
-        "json_list_list_path_pets[1:].name",
+    pytest.param(
         {"status_code": 200, "json": pet_list_instance_dict},
         {"200": List[str]},
         "pets[1:].name",
+        id="json_list_list_path_pets[1:].name",
     ),
     # invalid/partial data
-    (
-        "json_model_invalid_field",
+    pytest.param(
         {
             "status_code": 200,
             "json": {"name": 111, "owner": {"id": 456, "name": "Simon"}},
         },  # name type is int instead of str
         {"200": Pet},
         None,
+        id="json_model_invalid_field",
     ),
-    (
-        "json_model_invalid_submodel_field",
+    pytest.param(
         {
             "status_code": 200,
             "json": {"name": 111, "owner": {"id": "invalidId", "name": "Simon"}},
         },  # owner.id type is str instead of int
         {"200": Pet},
         None,
+        id="json_model_invalid_submodel_field",
     ),
-    (
-        "json_model_missing_field",
+    pytest.param(
         {
             "status_code": 200,
             "json": {"owner": {"id": 456, "name": "Simontis"}},
         },  # missing name
         {"200": Pet},
         None,
+        id="json_model_missing_field",
     ),
-    (
-        "json_model_missing_submodel_field",
+    pytest.param(
         {"status_code": 200, "json": {"name": "Chop"}},  # missing owner
         {"200": Pet},
         None,
+        id="json_model_missing_submodel_field",
     ),
-    (
-        "json_model_invalid_submodel_list_field",
+    pytest.param(
         {
             "status_code": 200,
             "json": {
@@ -635,9 +685,9 @@ DESERIALIZE_CASES = [
         },  # pets.0: id type is str instead of int, pets.1: missing owner
         {"200": PetList},
         None,
+        id="json_model_invalid_submodel_list_field",
     ),
-    (
-        "json_model_invalid_submodule_list",
+    pytest.param(
         {
             "status_code": 200,
             "json": [
@@ -647,14 +697,14 @@ DESERIALIZE_CASES = [
         },  # 0: id type is str instead of int, 1: missing owner
         {"200": List[Pet]},
         None,
+        id="json_model_invalid_submodule_list",
     ),
 ]
 
 
 @pytest.mark.parametrize(
     "response_kwargs,response_type,select_path",
-    [c[1:] for c in DESERIALIZE_CASES],
-    ids=[c[0] for c in DESERIALIZE_CASES],
+    DESERIALIZE_CASES,
 )
 def test_deserialize(
     snapshot,
@@ -680,16 +730,54 @@ def test_deserialize(
     ) == snapshot()
 
 
+@pytest.mark.parametrize(
+    "response_kwargs,response_type,response_type_name",
+    [
+        ({"status_code": 200, "text": "some_text"}, {"200": str}, {"200": "str"}),
+        ({"status_code": 200, "text": "123.456"}, {"200": float}, {"200": "float"}),
+        (
+            {"status_code": 202, "content": b"some binary file content,"},
+            {"202": bytearray},
+            {"2XX": "bytearray"},
+        ),
+    ],
+)
+def test_deserialize_type_name(
+    waylay_api_client: ApiClient,
+    response_kwargs: Dict[str, Any],
+    response_type: Any,
+    response_type_name: Any,
+):
+    """Response types given by name deserialize as the type itself."""
+    response = Response(**response_kwargs)
+    deserialized = waylay_api_client.deserialize(response, response_type=response_type)
+    deserialized_by_name = waylay_api_client.deserialize(
+        response, response_type=response_type_name
+    )
+    assert type(deserialized) is type(deserialized_by_name)
+    assert deserialized == deserialized_by_name
+
+
 class BytesResponseStream(httpx.AsyncByteStream):
+    # keeps the chunks, so that every iteration yields the full content
     def __init__(self, chunks: List[bytes]):
-        self.chunks_iter = iter(chunks)
+        self.chunks = list(chunks)
 
     async def __aiter__(self) -> AsyncIterator[bytes]:
-        for b in self.chunks_iter:
+        for b in self.chunks:
             yield b
 
     async def aclose(self) -> None:
-        self.chunks_iter = iter([])
+        self.chunks = []
+
+
+async def test_bytes_response_stream_reiterable():
+    """The test stream yields its full content on every iteration."""
+    stream = BytesResponseStream([b"a", b"b"])
+    assert [b async for b in stream] == [b"a", b"b"]
+    assert [b async for b in stream] == [b"a", b"b"]
+    await stream.aclose()
+    assert [b async for b in stream] == []
 
 
 ERROR_RESP_CASES = [
@@ -754,6 +842,7 @@ ERROR_RESP_CASES = [
 ]
 
 
+@pytest.mark.asyncio(scope="module")
 @pytest.mark.parametrize("response_kwargs,response_type", ERROR_RESP_CASES)
 async def test_deserialize_error_responses(
     snapshot,
@@ -775,6 +864,7 @@ async def test_deserialize_error_responses(
     ) == snapshot(name=str(response_type))
 
 
+@pytest.mark.asyncio(scope="module")
 async def test_deserialize_partially_fetched_error_stream(
     waylay_api_client: ApiClient, snapshot
 ):
@@ -789,20 +879,75 @@ async def test_deserialize_partially_fetched_error_stream(
     assert (str(excinfo.value),) == snapshot()
 
 
+async def test_response_error_str_after_read():
+    """The rendering of a response error follows the reading of the content."""
+    resp = Response(status_code=400, stream=BytesResponseStream([b"a", b"b", b"c"]))
+    error = RestResponseError("failed", response=resp)
+    assert "Response content: <streaming: len=0>" in str(error)
+    await resp.aread()
+    assert "Response content: <bytes: len=3>" in str(error)
+    assert str(error) is str(error)
+
+
+async def test_request_error_str_after_read():
+    """The rendering of a request error follows the reading of the content."""
+
+    async def _content():
+        yield b"abc"
+
+    req = Request("POST", "https://example.io/", content=_content())
+    error = RestRequestError("failed", request=req)
+    assert "Request content: <streaming:" in str(error)
+    await req.aread()
+    assert "Request content: <bytes: len=3>" in str(error)
+    assert str(error) is str(error)
+
+
+def test_deserialize_type_adapter_cached():
+    """Type adapters are reused for the same response type."""
+    from waylay.sdk.api.serialization import _type_adapter_for
+
+    assert _type_adapter_for(List[int]) is _type_adapter_for(List[int])
+    assert _type_adapter_for(Pet) is _type_adapter_for(Pet)
+    assert _type_adapter_for(List[int]).validate_python(["1"]) == [1]
+
+
+def test_deserialize_union_order(waylay_api_client: ApiClient):
+    """Unions that only differ in member order do not share a type adapter."""
+    response = Response(status_code=200, json="1")
+    for response_type, expected in [
+        (Union[int, float], 1),
+        (Union[float, int], 1.0),
+        (Union[int, float], 1),
+    ]:
+        deserialized = waylay_api_client.deserialize(
+            response, response_type={"200": response_type}
+        )
+        assert deserialized == expected
+        assert type(deserialized) is type(expected)
+
+
+def test_deserialize_select_path_compiled_once():
+    """Json paths are parsed once, together with their multiplicity."""
+    from waylay.sdk.api.serialization import _compile_select_path
+
+    expr, multiple = _compile_select_path("pets[*].name")
+    assert multiple
+    assert _compile_select_path("pets[*].name")[0] is expr
+    assert not _compile_select_path("pets[0].name")[1]
+
+
 def _retrieve_fixture_values(request, kwargs: Dict[str, Any]) -> Dict[str, Any]:
-    for arg_key, arg_value in kwargs.items():
+    # resolve into a new dict: the case definitions are shared between test runs.
+    return {key: _fixture_value(request, value) for key, value in kwargs.items()}
 
-        def _update_fixture_value(x):
-            if callable(x):
-                _arg_value = request.getfixturevalue(x.__name__)
-                kwargs.update({arg_key: _arg_value})  # noqa: B023
 
-        if isinstance(arg_value, list):
-            for x in arg_value:
-                _update_fixture_value(x)
-        else:
-            _update_fixture_value(arg_value)
-    return kwargs
+def _fixture_value(request, value: Any) -> Any:
+    if isinstance(value, list):
+        return [_fixture_value(request, item) for item in value]
+    if callable(value):
+        return request.getfixturevalue(value.__name__)
+    return value
 
 
 @pytest.mark.parametrize(
@@ -834,7 +979,7 @@ def _retrieve_fixture_values(request, kwargs: Dict[str, Any]) -> Dict[str, Any]:
         ],
     ],
 )
-async def test_request_timeout(
+def test_request_timeout(
     method,
     url,
     timeout,
@@ -0,0 +1,265 @@
+"""Test suite for package `waylay.sdk.auth`."""
+
+import asyncio
+import gc
+import json
+import sys
+import time
+import weakref
+from datetime import datetime
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from waylay.sdk.auth import (
+    ApplicationCredentials,
+    AuthError,
+    ClientCredentials,
+    NoCredentials,
+    TokenCredentials,
+    WaylayToken,
+    WaylayTokenAuth,
+    parse_credentials,
+)
+from waylay.sdk.auth.provider import (
+    _TOKEN_SOURCE_FOR_CLASS,
+    _shared_http_clients_async,
+)
+
+
+def test_token_auth_http_clients_lazy():
+    """Http clients are only created when used."""
+    auth = WaylayTokenAuth(ClientCredentials("", ""))
+    assert auth._http_client_sync is None
+    assert auth._http_client_async is None
+    assert isinstance(auth.http_client_sync, httpx.Client)
+    assert auth.http_client_sync is auth.http_client_sync
+    assert auth._http_client_async is None
+
+
+async def test_token_auth_http_clients_shared():
+    """Default http clients are shared between token providers."""
+    auth = WaylayTokenAuth(ClientCredentials("", ""))
+    other_auth = WaylayTokenAuth(TokenCredentials(""))
+    assert auth.http_client_sync is other_auth.http_client_sync
+    assert isinstance(auth.http_client_async, httpx.AsyncClient)
+    http_client = auth.http_client_async
+    assert http_client is other_auth.http_client_async
+    await other_auth.aclose()
+    assert http_client.is_closed
+    assert not auth.http_client_async.is_closed
+
+
+def test_token_auth_http_clients_released():
+    """Shared async http clients are released when closed."""
+    loop_refs = []
+
+    async def _request_once():
+        handled = asyncio.Event()
+
+        async def _handle(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\ncontent-length: 2\r\n\r\n{}")
+            await writer.drain()
+            # keep the connection open for as long as the client does
+            await reader.read()
+            writer.close()
+            await writer.wait_closed()
+            handled.set()
+
+        loop = asyncio.get_running_loop()
+        loop_refs.append(weakref.ref(loop))
+        server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        auth = WaylayTokenAuth(ClientCredentials("", ""))
+        response = await auth.http_client_async.get(f"http://127.0.0.1:{port}/")
+        assert response.status_code == 200
+        assert loop in _shared_http_clients_async
+        await auth.aclose()
+        assert loop not in _shared_http_clients_async
+        del loop
+        await asyncio.wait_for(handled.wait(), timeout=5)
+        server.close()
+        await server.wait_closed()
+
+    for _ in range(3):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(_request_once())
+        loop.close()
+    del loop
+    gc.collect()
+    assert [ref() for ref in loop_refs] == [None, None, None]
+
+
+def test_token_auth_http_client_provided():
+    """A provided http client is used for its own flavor only."""
+    http_client = httpx.AsyncClient()
+    auth = WaylayTokenAuth(ClientCredentials("", ""), http_client=http_client)
+    assert auth.http_client_async is http_client
+    assert auth._http_client_sync is None
+
+
+@pytest.mark.parametrize(
+    "credentials",
+    [
+        NoCredentials(gateway_url="https://api.example.io"),
+        ClientCredentials("key", "secret", gateway_url="https://api.example.io"),
+        ApplicationCredentials("key", "secret", "tenant"),
+        TokenCredentials("token", accounts_url="https://accounts.example.io"),
+    ],
+)
+def test_parse_credentials(credentials):
+    """Credentials survive a dict roundtrip."""
+    json_obj = credentials.to_dict(obfuscate=False)
+    assert parse_credentials(json_obj) == credentials
+    assert parse_credentials(credentials) is credentials
+    assert "type" in json_obj
+
+
+def test_parse_credentials_invalid():
+    """Invalid credential types are rejected."""
+    with pytest.raises(ValueError, match="missing type"):
+        parse_credentials({})
+    with pytest.raises(ValueError, match="credential type unknown"):
+        parse_credentials({"type": "unknown"})
+
+
+def test_slots():
+    """Tokens and credentials do not carry an instance dict."""
+    token = WaylayToken("", {"tenant": "t"})
+    assert not hasattr(token, "__dict__")
+    if sys.version_info >= (3, 10):
+        assert not hasattr(ClientCredentials("key", "secret"), "__dict__")
+        assert not hasattr(ApplicationCredentials("key", "secret", "t"), "__dict__")
+        assert not hasattr(TokenCredentials("token"), "__dict__")
+        assert not hasattr(NoCredentials(), "__dict__")
+
+
+def test_token_request(httpx_mock: HTTPXMock):
+    """Token request arguments are computed once per credentials."""
+    credentials = ApplicationCredentials(
+        "key", "secret", "tenant", gateway_url="https://api.example.io"
+    )
+    auth = WaylayTokenAuth(credentials)
+    for _ in range(2):
+        httpx_mock.add_response(json={"token": "abc"})
+        assert auth._request_token_sync(credentials) == "abc"
+    cached_args = auth._token_request_args
+    assert cached_args is not None
+    for request in httpx_mock.get_requests():
+        assert request.method == "POST"
+        assert request.url == (
+            "https://api.example.io/accounts/v1/tokens"
+            "?grant_type=application_credentials&tenant=tenant"
+        )
+        assert json.loads(request.content) == {
+            "applicationId": "key",
+            "applicationSecret": "secret",
+        }
+    other_credentials = ClientCredentials(
+        "key", "secret", accounts_url="https://accounts.example.io"
+    )
+    request = auth._token_request(other_credentials, auth.http_client_sync)
+    assert request.url == (
+        "https://accounts.example.io/tokens?grant_type=client_credentials"
+    )
+    assert auth._token_request_args is not cached_args
+
+
+def test_token_request_changed_credentials(httpx_mock: HTTPXMock):
+    """Token requests follow changes to the credentials."""
+    credentials = ClientCredentials(
+        "key", "old-secret", gateway_url="https://api.example.io"
+    )
+    auth = WaylayTokenAuth(credentials)
+    httpx_mock.add_response(json={"token": "abc"})
+    auth._request_token_sync(credentials)
+    credentials.api_secret = "new-secret"
+    credentials.accounts_url = "https://accounts.example.io"
+    httpx_mock.add_response(json={"token": "def"})
+    assert auth._request_token_sync(credentials) == "def"
+    request = httpx_mock.get_requests()[-1]
+    assert request.url == (
+        "https://accounts.example.io/tokens?grant_type=client_credentials"
+    )
+    assert json.loads(request.content) == {
+        "clientId": "key",
+        "clientSecret": "new-secret",
+    }
+
+
+class _MyTokenCredentials(TokenCredentials):
+    pass
+
+
+class _MyNoCredentials(NoCredentials):
+    pass
+
+
+def test_token_source_dispatch():
+    """Credentials subclasses are resolved to the token source of their base."""
+    auth = WaylayTokenAuth(_MyTokenCredentials("token"))
+    assert auth._validate_credentials() is auth.credentials
+    auth = WaylayTokenAuth(
+        NoCredentials(gateway_url="https://api.example.io"),
+        credentials_callback=lambda url: ClientCredentials("key", "secret"),
+    )
+    assert isinstance(auth._validate_credentials(), ClientCredentials)
+    with pytest.raises(AuthError, match="No credentials"):
+        WaylayTokenAuth(_MyNoCredentials())._validate_credentials()
+    # resolved subclasses are memoized in a bounded cache
+    assert _MyTokenCredentials not in _TOKEN_SOURCE_FOR_CLASS
+
+
+def test_token_is_valid():
+    """Token validity requires essential claims and no expiry."""
+    claims = {"tenant": "t", "sub": "s", "domain": "d", "exp": time.time() + 100}
+    assert WaylayToken("", claims).is_valid
+    assert not WaylayToken("", {**claims, "exp": time.time() - 100}).is_valid
+    assert WaylayToken("", {**claims, "exp": time.time() - 100}).is_expired
+    assert not WaylayToken("", {**claims, "exp": None}).is_valid
+    for claim in ["tenant", "sub", "domain"]:
+        assert not WaylayToken("", {**claims, claim: None}).is_valid
+
+
+def test_credentials_str_cached():
+    """The string representation is cached until an attribute changes."""
+    credentials = ClientCredentials("key", "s3cr3t")
+    cred_str = str(credentials)
+    assert '"api_key": "key"' in cred_str
+    assert "s3cr3t" not in cred_str
+    assert str(credentials) is cred_str
+    credentials.gateway_url = "https://api.example.io"
+    assert '"gateway_url": "https://api.example.io"' in str(credentials)
+    assert repr(credentials) == f"<ClientCredentials({credentials})>"
+
+
+def test_credentials_token_url():
+    """The token endpoint derives from the accounts or gateway url."""
+    credentials = ClientCredentials("key", "secret", gateway_url="https://gw")
+    assert credentials.token_url == "https://gw/accounts/v1/tokens"
+    credentials.accounts_url = "https://accounts"
+    assert credentials.token_url == "https://accounts/tokens"
+
+
+@pytest.mark.parametrize("token_string", ["", "abc", "a.b", "a.b.c.d", "a.b.c"])
+def test_token_malformed(token_string):
+    """Malformed token strings are rejected."""
+    with pytest.raises(AuthError, match="invalid token"):
+        WaylayToken(token_string)
+    assert not TokenCredentials(token_string).is_well_formed()
+
+
+def test_token_timestamps():
+    """Token timestamps are derived from the 'exp' and 'iat' claims."""
+    now = time.time()
+    token = WaylayToken("", {"exp": now + 100, "iat": now - 100})
+    assert token.expires_at == datetime.fromtimestamp(now + 100)
+    assert token.issued_at == datetime.fromtimestamp(now - 100)
+    assert 0 < token.expires_seconds <= 100
+    assert 100 <= token.age <= 101
+    token = WaylayToken("", {})
+    assert token.expires_at is None
+    assert token.issued_at is None
+    assert token.expires_seconds == 0
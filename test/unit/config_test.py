@@ -5,11 +5,13 @@ from typing import Iterator, Mapping
 
 import pytest
 from httpx import Request, Response
+from jose import jwt
 
 import waylay.sdk.auth.interactive
 import waylay.sdk.config
 from waylay.sdk import WaylayConfig
 from waylay.sdk.auth.provider import (
+    ApplicationCredentials,
     ClientCredentials,
     NoCredentials,
     TokenCredentials,
@@ -35,10 +37,6 @@ def mock_token(mocker):
         "waylay.sdk.auth.provider.WaylayTokenAuth._request_token_async",
         lambda *args: "",
     )
-    mocker.patch(
-        "waylay.sdk.auth.provider.WaylayTokenAuth._create_and_validate_token_async",
-        lambda *args: WaylayTokenStub(),
-    )
     mocker.patch(
         "waylay.sdk.auth.provider.WaylayTokenAuth._request_token_sync",
         lambda *args: "",
@@ -66,7 +64,7 @@ def mock_httpx_no_accounts(mocker):
     )
 
 
-async def test_empty_config():
+def test_empty_config():
     """Test an unconfigured WaylayConfig."""
     cfg = WaylayConfig()
     assert isinstance(cfg.auth, WaylayTokenAuth)
@@ -126,6 +124,25 @@ def test_tenant_settings(mock_httpx_accounts, mock_token):
     assert cfg.get_root_url("abc") == "http://yyy"
 
 
+def test_settings_merge(mock_httpx_accounts, mock_token):
+    """Test settings merge tenant settings with local overrides."""
+    cfg = WaylayConfig(credentials=TokenCredentials("_"), settings={"a": "b"})
+    settings = cfg.settings
+    assert isinstance(settings, dict)
+    assert settings == {**MOCK_TENANT_SETTINGS, "a": "b"}
+    settings["a"] = "c"
+    assert cfg.settings == {**MOCK_TENANT_SETTINGS, "a": "b"}
+    cfg.set_local_settings(a="c")
+    assert cfg.settings == {**MOCK_TENANT_SETTINGS, "a": "c"}
+    assert settings["waylay_api"] == MOCK_API_URL
+    cfg.local_settings["waylay_api"] = "https://other/api"  # type: ignore[index]
+    assert cfg.settings["waylay_api"] == "https://other/api"
+    assert cfg.get_root_url("api") == "https://other/api"
+    cfg.set_local_settings(a=None, waylay_api=None)
+    assert cfg.settings == MOCK_TENANT_SETTINGS
+    assert cfg.get_root_url("api") == MOCK_API_URL
+
+
 def test_gateway_settings(mock_httpx_accounts, mock_token):
     """Test resolution of gateway endpoints urls."""
     credentials = ClientCredentials("", "", gateway_url="https://gateway")
@@ -141,6 +158,126 @@ def test_gateway_settings(mock_httpx_accounts, mock_token):
     assert cfg.global_settings_url == "https://gateway/configs/v1/settings"
 
 
+def test_tenant_settings_cache(mocker, mock_token, monkeypatch, tmp_path):
+    """Test caching of tenant settings in a local file."""
+    cache_path = str(tmp_path / "settings_cache.json")
+    monkeypatch.setattr(
+        WaylayConfig, "settings_cache_path", classmethod(lambda cls: cache_path)
+    )
+    monkeypatch.setattr(WaylayConfig, "default_settings_cache_ttl", 60)
+    mock_send = mocker.patch(
+        "httpx._client.Client._send_single_request",
+        side_effect=_mock_send_single_request_accounts,
+        autospec=True,
+    )
+    credentials = ClientCredentials("key", "", gateway_url="https://gateway")
+    assert WaylayConfig(credentials).tenant_settings == MOCK_TENANT_SETTINGS
+    cfg = WaylayConfig(credentials)
+    assert cfg.tenant_settings == MOCK_TENANT_SETTINGS
+    assert mock_send.call_count == 1
+
+    cfg.invalidate_settings_cache()
+    assert cfg.tenant_settings == MOCK_TENANT_SETTINGS
+    assert mock_send.call_count == 2
+
+    other_credentials = ClientCredentials("other", "", gateway_url="https://gateway")
+    assert WaylayConfig(other_credentials).tenant_settings == MOCK_TENANT_SETTINGS
+    assert mock_send.call_count == 3
+
+
+def test_tenant_settings_cache_ttl(mocker, mock_token, monkeypatch, tmp_path):
+    """The tenant settings cache can be enabled per configuration."""
+    cache_path = str(tmp_path / "settings_cache.json")
+    monkeypatch.setattr(
+        WaylayConfig, "settings_cache_path", classmethod(lambda cls: cache_path)
+    )
+    mock_send = mocker.patch(
+        "httpx._client.Client._send_single_request",
+        side_effect=_mock_send_single_request_accounts,
+        autospec=True,
+    )
+    credentials = ClientCredentials("key", "", gateway_url="https://gateway")
+    cfg = WaylayConfig(credentials)
+    assert cfg.settings_cache_ttl is None
+    cfg.settings_cache_ttl = 60
+    assert cfg.tenant_settings == MOCK_TENANT_SETTINGS
+    cfg = WaylayConfig(credentials, settings_cache_ttl=60)
+    assert cfg.tenant_settings == MOCK_TENANT_SETTINGS
+    assert mock_send.call_count == 1
+    assert WaylayConfig(credentials).tenant_settings == MOCK_TENANT_SETTINGS
+    assert mock_send.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "cache_content",
+    [
+        "[]",
+        "not json",
+        '{"%(key)s": 1}',
+        '{"other": 1, "%(key)s": null}',
+        '{"%(key)s": {"expires": "never", "settings": {}}}',
+        '{"%(key)s": {"expires": 1e12, "settings": []}}',
+    ],
+)
+def test_tenant_settings_cache_corrupted(
+    cache_content, mocker, mock_token, monkeypatch, tmp_path
+):
+    """A corrupted tenant settings cache file is a cache miss."""
+    cache_file = tmp_path / "settings_cache.json"
+    monkeypatch.setattr(
+        WaylayConfig, "settings_cache_path", classmethod(lambda cls: str(cache_file))
+    )
+    mock_send = mocker.patch(
+        "httpx._client.Client._send_single_request",
+        side_effect=_mock_send_single_request_accounts,
+        autospec=True,
+    )
+    credentials = ClientCredentials("key", "", gateway_url="https://gateway")
+    cfg = WaylayConfig(credentials, settings_cache_ttl=60)
+    cache_file.write_text(cache_content % {"key": cfg._settings_cache_key()})
+    assert cfg.tenant_settings == MOCK_TENANT_SETTINGS
+    assert mock_send.call_count == 1
+    assert WaylayConfig(credentials, settings_cache_ttl=60).tenant_settings == (
+        MOCK_TENANT_SETTINGS
+    )
+    assert mock_send.call_count == 1
+
+
+def test_tenant_settings_cache_key():
+    """Cached tenant settings are keyed on the tenant of the credentials."""
+
+    def _cache_key(credentials):
+        return WaylayConfig(credentials)._settings_cache_key()
+
+    def _token(tenant):
+        return jwt.encode({"tenant": tenant}, "secret")
+
+    gateway_url = "https://gateway"
+    assert _cache_key(NoCredentials(gateway_url=gateway_url)) is None
+    assert _cache_key(TokenCredentials("_", gateway_url=gateway_url)) is None
+    assert _cache_key(
+        TokenCredentials(_token("t1"), gateway_url=gateway_url)
+    ) != _cache_key(TokenCredentials(_token("t2"), gateway_url=gateway_url))
+    assert _cache_key(
+        ApplicationCredentials("key", "", "t1", gateway_url=gateway_url)
+    ) != _cache_key(ApplicationCredentials("key", "", "t2", gateway_url=gateway_url))
+    assert _cache_key(
+        ApplicationCredentials("key", "", "t1", gateway_url=gateway_url)
+    ) == _cache_key(TokenCredentials(_token("t1"), gateway_url=gateway_url))
+
+
+def test_config_urls():
+    """Test the normalized urls follow the credentials."""
+    credentials = ClientCredentials("", "", gateway_url="gateway.example.io")
+    cfg = WaylayConfig(credentials, fetch_tenant_settings=False)
+    assert not hasattr(cfg, "__dict__")
+    assert cfg.gateway_url == "https://gateway.example.io"
+    assert cfg.gateway_url == "https://gateway.example.io"
+    credentials.gateway_url = "http://other"
+    assert cfg.gateway_url == "http://other"
+    assert cfg.accounts_url is None
+
+
 def test_empty_config_no_accounts(mock_httpx_no_accounts, mock_token):
     """Test handling of failure to retrieve accounts settings."""
     cfg = WaylayConfig(credentials=TokenCredentials("_"))
@@ -12,6 +12,7 @@ from starlette.responses import Response as StarletteResponse
 from waylay.sdk import WaylayClient, WaylayConfig, WaylayService, WaylayTool
 from waylay.sdk.api import AsyncClient
 from waylay.sdk.api._models import Model, _Model
+from waylay.sdk.auth import WaylayTokenAuth
 
 
 class MyService(WaylayService):
@@ -218,6 +219,11 @@ async def test_used_client_ctx(my_client: WaylayClient):
     assert my_client.tst.api_client is tst_client
     assert my_client.api_client is tst_client
 
+    # calling without options keeps the open client
+    assert my_client() is my_client
+    assert my_client.api_client is tst_client
+    assert not tst_http_client.is_closed
+
     async with my_client as m:
         # creates new api client in scope of main client
         # ALT: fails (dissallow mixing of ctx mgmt and lazy init)
@@ -280,6 +286,15 @@ async def test_reuse_config(my_client: WaylayClient):
     assert "tst" not in new_client.services
 
 
+def test_get_client(config: WaylayConfig):
+    """Test reuse of a client for the same config."""
+    client = WaylayClient.get(config)
+    assert WaylayClient.get(config) is client
+    assert client.config is config
+    assert WaylayClient.get(WaylayConfig(config.credentials)) is not client
+    assert WaylayClient.get(config, {"timeout": 5.0}) is not client
+
+
 async def test_reuse_api_client(my_client: WaylayClient):
     """Test reuse of api client."""
     new_client = WaylayClient(my_client.api_client)
@@ -299,3 +314,15 @@ async def test_reuse_http_client(my_client: WaylayClient):
     assert new_client.api_client is not my_client.api_client
     assert new_client.api_client.http_client is my_client.api_client.http_client
     assert new_client.config is my_client.config
+
+
+async def test_api_client_close_token_http_client(config: WaylayConfig, echo_app):
+    """Closing the api client closes the shared token http client."""
+    client = WaylayClient(config, {"transport": httpx.ASGITransport(echo_app)})
+    api_client = client.api_client
+    auth = api_client.http_client.auth
+    assert isinstance(auth, WaylayTokenAuth)
+    token_http_client = auth.http_client_async
+    await api_client.aclose()
+    assert token_http_client.is_closed
+    assert auth.http_client_async is not token_http_client
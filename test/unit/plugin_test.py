@@ -1,10 +1,15 @@
 """Test plugin system."""
 
+import copy
+import gc
+import pickle
 import re
+import weakref
 
 import pytest
 
 from waylay.sdk import WaylayClient, WaylayService, WaylayTool
+from waylay.sdk.plugin.base import PluginAccess
 
 sdk_test = pytest.importorskip("waylay.sdk_test", reason="Test plugin not installed.")
 ExampleService = sdk_test.ExampleService
@@ -21,6 +26,8 @@ def test_plugin_loaded(client: WaylayClient):
     """Test plugin classes are loaded."""
     assert isinstance(client.exampleService, ExampleService)
     assert isinstance(client.exampleTool, ExampleTool)
+    assert not hasattr(client.exampleService, "__dict__")
+    assert not hasattr(client.exampleTool, "__dict__")
 
 
 def test_service_access(client: WaylayClient):
@@ -38,6 +45,8 @@ def test_service_access(client: WaylayClient):
     assert srv == client.services.require(WaylayService, name=name)
     assert srv in client.services.values()
     assert name in client.services
+    assert client.services.get(name) is srv
+    assert client.services.get("not_a_service") is None
 
 
 def test_tool_access(client: WaylayClient):
@@ -100,6 +109,8 @@ def test_register(client: WaylayClient):
         assert client.services.require(MyOtherService)
     with pytest.raises(AttributeError):
         assert client.services.require(WaylayService, name=my_name)
+    with pytest.raises(AttributeError, match="WaylayService 'my_service'"):
+        assert client.services.my_service
 
     srv_cnt = len(client.services)
     srv = client.register(MyService)
@@ -138,3 +149,114 @@ def test_register_not_a_service(client: WaylayClient):
     """Test invalid registrations."""
     with pytest.warns(match="Invalid plug class"):
         assert client.register(NotAService) is None  # type: ignore
+
+
+class MyLazyService(WaylayService):
+    """Dummy Service."""
+
+    name = "my_lazy_service"
+    title = "Lazy Test Service"
+
+
+def test_register_lazy(client: WaylayClient):
+    """Test plugins given by reference are imported on first access."""
+    client._load_plugin_specs(
+        {"my_lazy_service": f"{MyLazyService.__module__}:MyLazyService"}
+    )
+    assert "my_lazy_service" not in client._services
+    srv = client.my_lazy_service
+    assert isinstance(srv, MyLazyService)
+    assert client.services["my_lazy_service"] is srv
+
+    client._load_plugin_specs(
+        {"my_lazy_service": f"{MyLazyService.__module__}:MyLazyService"}
+    )
+    assert "my_lazy_service" in client.services
+    assert client.services.require(MyLazyService) is not srv
+    assert not client._plugin_refs
+
+
+def test_register_lazy_import_failure(mocker, client: WaylayClient):
+    """Test a plugin reference is kept when its import fails."""
+    from waylay.sdk.plugin import client as plugin_client
+
+    mocker.patch.object(
+        plugin_client,
+        "_import_plugin_class",
+        side_effect=[ImportError("not yet"), MyLazyService],
+    )
+    client._load_plugin_specs(
+        {"my_lazy_service": f"{MyLazyService.__module__}:MyLazyService"}
+    )
+    with pytest.raises(ImportError, match="not yet"):
+        client.my_lazy_service  # noqa: B018
+    assert "my_lazy_service" in client._plugin_refs
+    assert isinstance(client.my_lazy_service, MyLazyService)
+    assert not client._plugin_refs
+
+
+def test_plugin_kind_released():
+    """Test the memoized plugin kind does not keep plugin classes alive."""
+    from waylay.sdk.plugin.client import _plugin_kind_for
+
+    class _TransientService(WaylayService):
+        name = "transient"
+
+    assert _plugin_kind_for(_TransientService) == "service"
+    assert _plugin_kind_for(_TransientService) == "service"
+    class_ref = weakref.ref(_TransientService)
+    del _TransientService
+    gc.collect()
+    assert class_ref() is None
+
+
+def test_plugin_discovery_cached(mocker, config):
+    """Test plugin loaders are discovered once."""
+    from waylay.sdk.plugin import client as plugin_client
+
+    plugin_client._reset_plugin_cache()
+    discover = mocker.spy(plugin_client, "entry_points")
+    WaylayClient(config)
+    client = WaylayClient(config)
+    assert discover.call_count == 1
+    assert isinstance(client.exampleService, ExampleService)
+    plugin_client._reset_plugin_cache()
+    WaylayClient(config)
+    assert discover.call_count == 2
+
+
+def test_plugin_access_slots(client: WaylayClient):
+    """Test plugin accessors do not carry an instance dict."""
+    assert not hasattr(client.services, "__dict__")
+    assert not hasattr(client.tools, "__dict__")
+    with pytest.raises(AttributeError):
+        assert client.services._not_a_slot
+
+
+def test_plugin_access_copy(client: WaylayClient):
+    """Test plugin accessors can be copied and pickled."""
+    services = copy.copy(client.services)
+    assert services is not client.services
+    assert services.exampleService is client.services.exampleService
+    assert dict(copy.deepcopy(PluginAccess({}, WaylayService))) == {}
+    access = pickle.loads(pickle.dumps(PluginAccess({"a": 1}, WaylayService)))
+    assert access.base_class is WaylayService
+    assert access["a"] == 1
+
+
+def test_plugin_discovery_invalid(mocker, config):
+    """Test invalid plugin classes of a loader are dropped with a single warning."""
+    from waylay.sdk.plugin import client as plugin_client
+
+    loader = mocker.Mock()
+    loader.load.return_value = [MyService, NotAService]
+    mocker.patch.object(plugin_client, "_plugin_entry_points", return_value=[loader])
+    plugin_client._reset_plugin_cache()
+    try:
+        with pytest.warns(match="Invalid plug class") as record:
+            client = WaylayClient(config)
+            WaylayClient(config)
+        assert len(record) == 1
+        assert isinstance(client.my_service, MyService)
+    finally:
+        plugin_client._reset_plugin_cache()